@@ -3,8 +3,14 @@
 
 # pylint: disable=missing-docstring
 import unittest
+from unittest import mock
+import bisect
+import itertools
+import operator
 import random
 import time
+import os
+import tempfile
 from collections import deque
 
 random.seed(42)
@@ -19,37 +25,48 @@ except ImportError:
                 return False 
         return True 
 
+try:
+    import numpy
+except ImportError:     # numpy is optional, some tests need it
+    numpy = None
+
 from tryalgo.graph import write_graph, extract_path, make_flow_labels
 from tryalgo.graph import tree_adj_to_prec, tree_prec_to_adj
 from tryalgo.graph import matrix_to_listlist, listlist_and_matrix_to_listdict
 from tryalgo.graph import listdict_to_listlist_and_matrix, dictdict_to_listdict
-from tryalgo.a_star import a_star
+from tryalgo.graph import CSRGraph, listlist_and_matrix_to_csr, listdict_to_csr
+from tryalgo.graph import matrix_to_csr, csr_to_listdict, arcs_to_csr
+from tryalgo.graph import read_graph, write_graph_binary, open_graph_mmap
+from tryalgo.a_star import a_star, a_star_weighted, Landmarks
 from tryalgo.anagrams import anagrams
 from tryalgo.arithm_expr_eval import arithm_expr_eval, arithm_expr_parse
 from tryalgo.arithm_expr_target import arithm_expr_target
-from tryalgo.bellman_ford import bellman_ford, bellman_ford2
+from tryalgo.bellman_ford import bellman_ford, bellman_ford2, bellman_ford_queue
 from tryalgo.knapsack import knapsack, knapsack2
 from tryalgo.bfs import bfs, bfs_implicit
 from tryalgo.biconnected_components import cut_nodes_edges, cut_nodes_edges2
 from tryalgo.binary_search import continuous_binary_search, discrete_binary_search, optimized_binary_search, optimized_binary_search_lower, ternary_search
-from tryalgo.bipartite_matching import max_bipartite_matching
+from tryalgo.bipartite_matching import max_bipartite_matching, hopcroft_karp
 from tryalgo.bipartite_vertex_cover import bipartite_vertex_cover
 from tryalgo.closest_points import closest_points
 from tryalgo.closest_values import closest_values
+from tryalgo.contraction_hierarchy import ContractionHierarchy
 from tryalgo.convex_hull import left_turn, andrew
 from tryalgo.dancing_links import dancing_links
+from tryalgo.dial import dial, radix_dijkstra, dijkstra_integer
 from tryalgo.dfs import find_cycle, dfs_recursive, dfs_iterative, dfs_grid, dfs_grid_recursive, dfs_tree, is_bipartite
-from tryalgo.dijkstra import dijkstra_update_heap, dijkstra
+from tryalgo.dijkstra import dijkstra_update_heap, dijkstra, bidirectional_dijkstra
 from tryalgo.dilworth import dilworth
-from tryalgo.dinic import dinic
+from tryalgo.dinic import dinic, dinic_iterative, IncrementalMaxFlow
 from tryalgo.dist_grid import dist_grid
+from tryalgo.dynamic_connectivity import RollbackUnionFind, dynamic_connectivity
 from tryalgo.dyn_prog_tricks import dyn_prog_Monge, decode_root_matrix_to_level, opt_bin_search_tree1, opt_bin_search_tree2
 from tryalgo.edmonds_karp import edmonds_karp
 from tryalgo.eulerian_tour import eulerian_tour_undirected, eulerian_tour_directed, random_eulerien_graph, is_eulerian_tour_directed, is_eulerian_tour_undirected
 from tryalgo.fast_exponentiation import fast_exponentiation, fast_exponentiation2
-from tryalgo.fenwick import Fenwick, FenwickMin
+from tryalgo.fenwick import Fenwick, FenwickMin, FenwickND, FenwickNDRange
 from tryalgo.fft import fft, inv_fft, mul_poly_fft, pad
-from tryalgo.floyd_warshall import floyd_warshall, floyd_warshall2
+from tryalgo.floyd_warshall import floyd_warshall, floyd_warshall2, floyd_warshall_vectorized
 from tryalgo.ford_fulkerson import ford_fulkerson
 from tryalgo.gale_shapley import gale_shapley
 from tryalgo.gauss_jordan import gauss_jordan, GJ_ZERO_SOLUTIONS, GJ_SINGLE_SOLUTION, GJ_SEVERAL_SOLUTIONS
@@ -61,11 +78,13 @@ from tryalgo.huffman import huffman
 from tryalgo.interval_tree import interval_tree, intervals_containing
 from tryalgo.interval_cover import interval_cover
 from tryalgo.intervals_union import intervals_union
+from tryalgo.johnson import johnson
 from tryalgo.karatsuba import mul_poly
 from tryalgo.knuth_morris_pratt import maximum_border_length, knuth_morris_pratt, powerstring_by_border, powerstring_by_find
-from tryalgo.kruskal import kruskal
+from tryalgo.kruskal import kruskal, UnionFind
 from tryalgo.kuhn_munkres_n4 import kuhn_munkres as kuhn_munkres_n4
 from tryalgo.kuhn_munkres import kuhn_munkres as kuhn_munkres_n3
+from tryalgo.kuhn_munkres import kuhn_munkres_vectorized
 from tryalgo.rabin_karp import rabin_karp_matching
 from tryalgo.roman_numbers import roman2int, int2roman
 from tryalgo.laser_mirrors import laser_mirrors
@@ -79,8 +98,10 @@ from tryalgo.manacher import manacher
 from tryalgo.matrix_chain_mult import matrix_mult_opt_order, matrix_chain_mult
 from tryalgo.max_interval_intersec import max_interval_intersec
 from tryalgo.merge_ordered_lists import merge
+from tryalgo.min_cost_flow import min_cost_flow
+from tryalgo.minimum_spanning_tree import prim, boruvka, minimum_spanning_tree
 from tryalgo.min_mean_cycle import min_mean_cycle
-from tryalgo.our_heap import OurHeap
+from tryalgo.our_heap import OurHeap, IndexedHeap
 from tryalgo.our_queue import OurQueue
 from tryalgo.permutation_rank import permutation_rank, rank_permutation
 from tryalgo.pareto import pareto2d, pareto3d
@@ -89,15 +110,17 @@ from tryalgo.polygon import area, is_simple
 # from tryalgo.pq_tree import consecutive_ones_property, PQTree
 from tryalgo.predictive_text import predictive_text, propose
 from tryalgo.primes import eratosthene, gries_misra
+from tryalgo.push_relabel import push_relabel
 from tryalgo.rabin_karp import rabin_karp_factor
-from tryalgo.range_minimum_query import RangeMinQuery, LazySegmentTree
+from tryalgo.range_minimum_query import RangeMinQuery, LazySegmentTree, \
+    SparseTable, BlockSparseTable, SegmentTree
 from tryalgo.rectangles_from_grid import rectangles_from_grid
 from tryalgo.rectangles_from_histogram import rectangles_from_histogram
 from tryalgo.rectangles_from_points import rectangles_from_points
 from tryalgo.scalar import min_scalar_prod
 from tryalgo.shortest_cycle import shortest_cycle, powergraph
 from tryalgo.skip_list import SortedSet, SortedDict
-from tryalgo.strongly_connected_components import tarjan, kosaraju, tarjan_recursif
+from tryalgo.strongly_connected_components import tarjan, kosaraju, tarjan_recursif, condensation
 from tryalgo.subsetsum_divide import subset_sum as subset_sum1
 from tryalgo.subsetsum_divide import subset_sum2 as subset_sum2
 from tryalgo.subsetsum import subset_sum as subset_sum3, coin_change
@@ -184,6 +207,46 @@ class TestTryalgo(unittest.TestCase):
         self.assertEqual(a_star(swaps, c, distance_lb), 11)
         self.assertEqual(a_star(swaps, d, distance_lb), -1)
 
+    def test_a_star_weighted(self):
+        for _ in range(20):
+            n = random.randint(1, 30)
+            sparse = [{v: random.randint(0, 9) for v in range(n)
+                       if v != u and random.random() < 0.15}
+                      for u in range(n)]
+            graph, weight = listdict_to_listlist_and_matrix(sparse)
+            landmarks = Landmarks(sparse, sparse, min(n, 3))
+            self.assertEqual(len(set(landmarks.landmarks)), min(n, 3))
+            csr = listdict_to_csr(sparse)
+            self.assertEqual(Landmarks(csr, csr, landmarks.landmarks).dist_to,
+                             landmarks.dist_to)
+            for source in range(n):
+                dist, _ = dijkstra(sparse, sparse, source)
+                for target in range(n):
+                    lower_bound = landmarks.lower_bound(target)
+                    self.assertLessEqual(lower_bound(source), dist[target])
+                    for g, w in [(sparse, sparse), (graph, weight), (csr, csr)]:
+                        dist_a, prec = a_star_weighted(g, w, source, target,
+                                                       lower_bound)
+                        self.assertEqual(dist_a[target], dist[target])
+                        if dist[target] < float('inf'):
+                            path = extract_path(prec, target)
+                            self.assertEqual(path[0], source)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_landmarks_numpy(self):
+        for _ in range(20):
+            n = random.randint(1, 30)
+            sparse = [{v: random.randint(0, 9) for v in range(n)
+                       if v != u and random.random() < 0.1}
+                      for u in range(n)]
+            landmarks = Landmarks(sparse, sparse, min(n, 4))
+            for target in range(n):
+                bound = landmarks.lower_bound(target)
+                with mock.patch('tryalgo.a_star.np', None):
+                    loop = landmarks.lower_bound(target)
+                self.assertEqual([bound(v) for v in range(n)],
+                                 [loop(v) for v in range(n)])
+
     def test_anagrams(self):
         L = [(set("le chien marche vers sa niche et trouve une "
                   "limace de chine nue pleine de malice "
@@ -272,7 +335,8 @@ class TestTryalgo(unittest.TestCase):
     def test_bellman_ford(self):
         for title, graph, weight, has_circuit, shortest_path in self.L_dir:
             sparse = listlist_and_matrix_to_listdict(graph, weight)
-            for g, w in [(graph, weight), (sparse, sparse)]:
+            csr = listlist_and_matrix_to_csr(graph, weight)
+            for g, w in [(graph, weight), (sparse, sparse), (csr, csr)]:
                 for algo in [bellman_ford, bellman_ford2]:
                     dist, prec, detect = algo(g, w, 0)
                     self.assertEqual(has_circuit, detect)
@@ -283,6 +347,26 @@ class TestTryalgo(unittest.TestCase):
                             self.assertEqual(path, shortest_path)
                         else:
                             self.assertEqual(dist[target], float('inf'))
+                dist, prec, cycle = bellman_ford_queue(g, w, 0)
+                self.assertEqual(has_circuit, cycle is not None)
+                if has_circuit:
+                    self.assertLess(sum(weight[cycle[i - 1]][cycle[i]]
+                                        for i in range(len(cycle))), 0)
+                elif shortest_path is not None:
+                    path = extract_path(prec, len(graph) - 1)
+                    self.assertEqual(path, shortest_path)
+        for _ in range(50):
+            n = random.randint(1, 15)
+            sparse = [{v: random.randint(-3, 9) for v in range(n)
+                       if random.random() < 0.2} for u in range(n)]
+            dist, _, detect = bellman_ford(sparse, sparse, 0)
+            dist_q, _, cycle = bellman_ford_queue(sparse, sparse, 0)
+            self.assertEqual(detect, cycle is not None)
+            if cycle is None:
+                self.assertEqual(dist, dist_q)
+            else:
+                self.assertLess(sum(sparse[cycle[i - 1]][cycle[i]]
+                                    for i in range(len(cycle))), 0)
 
     def test_bfs(self):
         # graphe complet plus un sommet isolé
@@ -307,7 +391,8 @@ class TestTryalgo(unittest.TestCase):
              ([[1], [0]], 0, ([0, 1], [None, 0]))]
         for graph, source, answer in L:
             # V = range(len(graph))
-            for g in [graph, listlist_and_matrix_to_listdict(graph)]:
+            for g in [graph, listlist_and_matrix_to_listdict(graph),
+                      listlist_and_matrix_to_csr(graph)]:
                 self.assertEqual(bfs(g, source), answer)
 
     def test_bfs_implicit(self):
@@ -431,6 +516,19 @@ class TestTryalgo(unittest.TestCase):
         n = 100
         G = half_graph(n)
         self.assertEqual([None]+list(range(n-1)), max_bipartite_matching(G))
+        self.assertEqual([None]+list(range(n-1)), hopcroft_karp(G))
+        self.assertEqual([], hopcroft_karp([]))
+        for n in range(1, 30):
+            G = random_graph(n, 0.1)
+            match = hopcroft_karp(G)
+            self.assertEqual(match.count(None),
+                             max_bipartite_matching(G).count(None))
+            for v, u in enumerate(match):
+                if u is not None:
+                    self.assertIn(v, G[u])
+        n = 100000                          # long augmenting paths
+        G = [[u, u + 1] for u in range(n - 1)] + [[0]]
+        self.assertEqual(hopcroft_karp(G).count(None), 0)
 
 
     def test_bipartite_vertex_cover(self):
@@ -520,6 +618,9 @@ class TestTryalgo(unittest.TestCase):
             seen = [False] * n
             dfs(listlist_and_matrix_to_listdict(graph), start, seen)
             self.assertEqual(retval, [node for node in range(n) if seen[node]])
+            seen = [False] * n
+            dfs(listlist_and_matrix_to_csr(graph), start, seen)
+            self.assertEqual(retval, [node for node in range(n) if seen[node]])
             return retval
 
         n = 100000
@@ -637,7 +738,10 @@ XXXXX#...#
         for f in [dijkstra, dijkstra_update_heap]:
             for title, graph, weight, shortest_path in L_dir:
                 sparse = listlist_and_matrix_to_listdict(graph, weight)
-                for g, w in [(graph, weight), (sparse, sparse)]:
+                csr = listlist_and_matrix_to_csr(graph, weight)
+                pairs = [(graph, weight), (sparse, sparse), (csr, weight),
+                         (csr, csr)]
+                for g, w in pairs:
                     source = 0
                     target = len(g) - 1
                     dist, prec = f(g, w, source, target)
@@ -649,6 +753,116 @@ XXXXX#...#
                         val = sum(weight[path[i]][path[i + 1]]
                                   for i in range(len(path) - 1))
                         self.assertEqual(dist[target], val)
+        unweighted = listlist_and_matrix_to_csr([[1], []])
+        self.assertIsNone(unweighted.min_weight)
+        for f in [dijkstra, dijkstra_update_heap]:
+            with self.assertRaises(ValueError):
+                f(unweighted, unweighted, 0)
+        # graph[u][v] on a csr graph is not the weight of the arc (u, v)
+        sparse = [{1: 50, 2: 50, 0: 0}, {0: 50, 2: 50, 1: 0},
+                  {0: 50, 1: 50, 2: 0}]
+        csr = listdict_to_csr(sparse)
+        for f in [dijkstra, dijkstra_update_heap]:
+            self.assertEqual(f(csr, csr, 0)[0], [0, 50, 50])
+        self.assertEqual(bellman_ford2(csr, csr, 0)[0], [0, 50, 50])
+        for title, graph, weight, shortest_path in L_dir:
+            sparse = listlist_and_matrix_to_listdict(graph, weight)
+            csr = listlist_and_matrix_to_csr(graph, weight)
+            for g, w in [(graph, weight), (sparse, sparse), (csr, csr)]:
+                dist, path = bidirectional_dijkstra(g, w, 0, len(g) - 1)
+                self.assertEqual(path, shortest_path)
+                if shortest_path is None:
+                    self.assertEqual(dist, float('inf'))
+
+    def test_bidirectional_dijkstra(self):
+        for _ in range(20):
+            n = random.randint(1, 30)
+            sparse = [{v: random.randint(0, 9) for v in range(n)
+                       if v != u and random.random() < 0.15}
+                      for u in range(n)]
+            csr = listdict_to_csr(sparse)
+            for source in range(n):
+                dist, _ = dijkstra(sparse, sparse, source)
+                for target in range(n):
+                    for g in [sparse, csr]:
+                        val, path = bidirectional_dijkstra(g, g, source,
+                                                           target)
+                        self.assertEqual(val, dist[target])
+                        if path is not None:
+                            self.assertEqual(path[0], source)
+                            self.assertEqual(path[-1], target)
+                            self.assertEqual(sum(sparse[path[i]][path[i + 1]]
+                                                 for i in range(len(path) - 1)),
+                                             val)
+
+    def test_dial(self):
+        for max_weight in [0, 1, 5, 64, 1000, 10 ** 12]:
+            n = 40
+            sparse = [{v: random.randint(0, max_weight) for v in range(n)
+                       if v != u and random.random() < 0.1}
+                      for u in range(n)]
+            graph, weight = listdict_to_listlist_and_matrix(sparse)
+            csr = listdict_to_csr(sparse)
+            for source in range(0, n, 7):
+                dist, _ = dijkstra(sparse, sparse, source)
+                for f in [dial, radix_dijkstra, dijkstra_integer]:
+                    if f is dial and max_weight > 1000:
+                        continue
+                    for g, w in [(sparse, sparse), (graph, weight),
+                                 (csr, csr)]:
+                        dist_f, prec = f(g, w, source)
+                        self.assertEqual(dist_f, dist)
+                        for v in range(n):
+                            if prec[v] is not None:
+                                self.assertEqual(dist[prec[v]] + sparse[prec[v]][v],
+                                                 dist[v])
+                        target = n - 1
+                        dist_f, prec = f(g, w, source, target)
+                        self.assertEqual(dist_f[target], dist[target])
+        sparse = [{1: 50, 2: 50, 0: 0}, {0: 50, 2: 50, 1: 0},
+                  {0: 50, 1: 50, 2: 0}]
+        csr = listdict_to_csr(sparse)
+        for f in [dial, radix_dijkstra, dijkstra_integer]:
+            self.assertEqual(f(csr, csr, 0)[0], [0, 50, 50])
+
+    def test_contraction_hierarchy(self):
+        for _ in range(30):
+            n = random.randint(1, 25)
+            sparse = [{v: random.randint(0, 9) for v in range(n)
+                       if v != u and random.random() < 0.2}
+                      for u in range(n)]
+            graph, weight = listdict_to_listlist_and_matrix(sparse)
+            for g, w in [(sparse, sparse), (graph, weight)]:
+                hierarchy = ContractionHierarchy(g, w, random.choice([1, 500]))
+                for source in range(n):
+                    dist, _ = dijkstra(sparse, sparse, source)
+                    for target in range(n):
+                        val, path = hierarchy.query(source, target)
+                        self.assertEqual(val, dist[target])
+                        if path is None:
+                            self.assertEqual(val, float('inf'))
+                        else:
+                            self.assertEqual(path[0], source)
+                            self.assertEqual(path[-1], target)
+                            self.assertEqual(
+                                sum(sparse[path[i]][path[i + 1]]
+                                    for i in range(len(path) - 1)), val)
+        fd, filename = tempfile.mkstemp(suffix=".ch")
+        os.close(fd)
+        try:
+            hierarchy.save(filename)
+            loaded = ContractionHierarchy.load(filename)
+            self.assertIsInstance(loaded.up.target, memoryview)
+            with open(filename, 'r+b') as f:
+                f.write(b'PICKLE')
+            with self.assertRaises(ValueError):
+                ContractionHierarchy.load(filename)
+        finally:
+            os.remove(filename)
+        for source in range(n):
+            for target in range(n):
+                self.assertEqual(loaded.query(source, target),
+                                 hierarchy.query(source, target))
 
     def test_fft(self):
         L = [[0,1], [1,1], [2,2], [3,4], [4,4], [5,8]]
@@ -705,7 +919,8 @@ XXXXX#...#
                     [_, _, _, _, _, _, 99, _, _, 0, _, 7],
                     [_, _, _, _, _, _, 99, _, _, _, 0, 10],
                     [_, _, _, _, _, _, _, 15, 3, 7, 10, 0]]
-        for f in [dinic, edmonds_karp, ford_fulkerson]:
+        for f in [dinic, dinic_iterative, edmonds_karp, ford_fulkerson,
+                  push_relabel]:
             sparse = listlist_and_matrix_to_listdict(graph, capacity)
             for g, w in [(graph, capacity), (sparse, sparse)]:
                 flow_matr, flow_val = f(g, w, 0, 11)
@@ -713,9 +928,106 @@ XXXXX#...#
                 # labels = make_flow_labels(g, flow_matr, w)
                 # write_graph("dinic.dot", graph, directed=True, arc_label=labels)
         graph = [{1: 9, 2: 9}, {3: 1}, {4: 1}, {5: 9}, {5: 9}, {}]
-        for f in [dinic, edmonds_karp, ford_fulkerson]:
+        for f in [dinic, dinic_iterative, edmonds_karp, ford_fulkerson,
+                  push_relabel]:
             flow_matr, flow_val = f(graph, graph, 0, 5)
             self.assertEqual(flow_val, 2)
+        graph = [{1: 9, 2: 9}, {3: 1}, {4: 1}, {5: 9}, {5: 9}, {}]
+        stats = {}
+        flow, flow_val = dinic_iterative(graph, graph, 0, 5, stats)
+        self.assertEqual(flow[0], {1: 1, 2: 1})
+        self.assertEqual(flow[5], {3: -1, 4: -1})
+        self.assertEqual(stats['augmentations'], 2)
+        self.assertEqual(graph[1], {3: 1})      # input is not modified
+        n = 3000                                # deep level graph
+        path = [{u + 1: 5} for u in range(n - 1)] + [{}]
+        self.assertEqual(dinic_iterative(path, path, 0, n - 1)[1], 5)
+        for _ in range(100):
+            n = random.randint(2, 15)
+            graph = [{v: random.randint(0, 9) for v in range(n)
+                      if v != u and random.random() < 0.3} for u in range(n)]
+            value = dinic_iterative(graph, graph, 0, n - 1)[1]
+            for rule in ['fifo', 'highest']:
+                flow, flow_val = push_relabel(graph, graph, 0, n - 1, rule)
+                self.assertEqual(flow_val, value)
+                for u in range(1, n - 1):
+                    self.assertEqual(sum(flow[u].values()), 0)
+                    for v in flow[u]:
+                        self.assertLessEqual(flow[u][v], graph[u].get(v, 0))
+        self.assertRaises(ValueError, push_relabel, graph, graph, 0, 1, "lifo")
+
+    def test_incremental_max_flow(self):
+        graph = [{1: 9, 2: 9}, {3: 1}, {4: 1}, {5: 9}, {5: 9}, {}]
+        inc = IncrementalMaxFlow(graph, graph, 0, 5)
+        self.assertEqual(inc.max_flow(), 2)
+        inc.set_capacity(1, 3, 5)
+        self.assertEqual(inc.max_flow(), 6)
+        inc.set_capacity(0, 1, 2)
+        self.assertEqual(inc.capacity(0, 1), 2)
+        self.assertEqual(inc.max_flow(), 3)
+        self.assertEqual(inc.flow()[3], {1: -2, 5: 2})
+        self.assertRaises(KeyError, inc.set_capacity, 0, 5, 1)
+        for _ in range(50):
+            n = random.randint(2, 10)
+            graph = [{v: random.randint(0, 9) for v in range(n)
+                      if v != u and random.random() < 0.4} for u in range(n)]
+            arcs = [(u, v) for u in range(n) for v in graph[u]]
+            inc = IncrementalMaxFlow(graph, graph, 0, n - 1)
+            for _ in range(5):
+                value = dinic_iterative(graph, graph, 0, n - 1)[1]
+                self.assertEqual(inc.max_flow(), value)
+                flow = inc.flow()
+                for u in range(1, n - 1):
+                    self.assertEqual(sum(flow[u].values()), 0)
+                if arcs:
+                    u, v = random.choice(arcs)
+                    graph[u][v] = random.randint(0, 9)
+                    inc.set_capacity(u, v, graph[u][v])
+
+    def test_dynamic_connectivity(self):
+        u_f = RollbackUnionFind(4)
+        u_f.union(0, 1)
+        checkpoint = u_f.checkpoint()
+        self.assertTrue(u_f.union(2, 3))
+        self.assertTrue(u_f.union(1, 3))
+        self.assertFalse(u_f.union(0, 2))
+        self.assertEqual(u_f.nb_components, 1)
+        u_f.rollback(checkpoint)
+        self.assertEqual(u_f.nb_components, 3)
+        self.assertEqual(u_f.find(0), u_f.find(1))
+        self.assertNotEqual(u_f.find(1), u_f.find(2))
+        self.assertNotEqual(u_f.find(2), u_f.find(3))
+        operations = [('add', 0, 1), ('add', 1, 2), ('query', 0, 2),
+                      ('remove', 0, 1), ('query', 0, 2), ('add', 1, 0),
+                      ('add', 0, 1), ('remove', 1, 0), ('query', 2, 0),
+                      ('query', 3, 3), ('query', 0, 3)]
+        self.assertEqual(dynamic_connectivity(4, operations),
+                         [True, False, True, True, False])
+        self.assertEqual(dynamic_connectivity(2, []), [])
+        self.assertRaises(ValueError, dynamic_connectivity, 2,
+                          [('remove', 0, 1)])
+        for _ in range(50):             # compare with static union-find
+            n = random.randint(1, 8)
+            operations = []
+            edges = []
+            for _ in range(30):
+                u = random.randrange(n)
+                v = random.randrange(n)
+                if random.random() < 0.3 and edges:
+                    u, v = edges.pop(random.randrange(len(edges)))
+                    operations.append(('remove', u, v))
+                elif random.random() < 0.5:
+                    edges.append((u, v))
+                    operations.append(('add', u, v))
+                else:
+                    u_f = UnionFind(n)
+                    u_f.union_many([a for a, _ in edges], [b for _, b in edges])
+                    operations.append(('query', u, v))
+                    expected = u_f.find(u) == u_f.find(v)
+                    operations[-1] += (expected,)
+            answers = dynamic_connectivity(n, [op[:3] for op in operations])
+            self.assertEqual(answers, [op[3] for op in operations
+                                       if op[0] == 'query'])
 
     def test_dist_grid(self):
         G = '''\
@@ -827,7 +1139,80 @@ t##
                 tab[j] += c 
         for i, ti in enumerate(tab):
             self.assertEqual(ti, F.get(i))
+        for n in [0, 1, 7, 64, 100]:
+            tab = [random.randint(0, 9) for _ in range(n)]
+            F = Fenwick(tab)
+            for batch in [3, 1000]:         # small and large batches
+                indices = [random.randrange(n) for _ in range(batch)] \
+                    if n else []
+                values = [random.randint(0, 5) for _ in indices]
+                F.add_many(indices, values)
+                for a, val in zip(indices, values):
+                    tab[a] += val
+                prefix = [sum(tab[:a + 1]) for a in range(n)]
+                self.assertEqual(F.prefix_sums(indices),
+                                 [prefix[a] for a in indices])
+                for val in range(sum(tab) + 2):
+                    self.assertEqual(F.lower_bound(val),
+                                     bisect.bisect_left(prefix, val))
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_fenwick_numpy(self):
+        tab = [random.randint(0, 9) for _ in range(50)]
+        F = Fenwick(tab)
+        indices = numpy.array([random.randrange(50) for _ in range(100)])
+        values = numpy.array([random.randint(0, 5) for _ in indices])
+        F.add_many(indices, values)
+        for a, val in zip(indices.tolist(), values.tolist()):
+            tab[a] += val
+        prefix = list(itertools.accumulate(tab))
+        sums = F.prefix_sums(indices)
+        self.assertIsInstance(sums, numpy.ndarray)
+        self.assertEqual(sums.tolist(), [prefix[a] for a in indices])
+        few = numpy.array([0, 17, 49])     # small batch, no linear pass
+        with mock.patch.object(F, '_all_prefix_sums') as all_sums:
+            sums = F.prefix_sums(few)
+        all_sums.assert_not_called()
+        self.assertIsInstance(sums, numpy.ndarray)
+        self.assertEqual(sums.tolist(), [prefix[a] for a in few])
+
+    def test_fenwick_nd(self):
+        for shape in [(1,), (7,), (4, 5), (3, 1, 4)]:
+            cells = list(itertools.product(*[range(n) for n in shape]))
+            tab = {cell: random.randint(-5, 5) for cell in cells}
+            nested = [tab[cell] for cell in cells]
+            for n in reversed(shape[1:]):
+                nested = [nested[i:i + n] for i in range(0, len(nested), n)]
+            F = FenwickND(shape, nested)
+            R = FenwickNDRange(shape)
+            G = FenwickND(shape)
+            diff = dict.fromkeys(cells, 0)
+
+            def box(table, low, high):
+                return sum(table[cell] for cell in cells
+                           if all(low[k] <= cell[k] <= high[k]
+                                  for k in range(len(shape))))
 
+            for _ in range(20):
+                low = tuple(random.randrange(n) for n in shape)
+                high = tuple(random.randint(lo, n - 1)
+                             for lo, n in zip(low, shape))
+                val = random.randint(-3, 3)
+                F.add(low, val)
+                tab[low] += val
+                R.box_add(low, high, val)
+                G.box_add(low, high, val)
+                for cell in cells:
+                    if all(low[k] <= cell[k] <= high[k]
+                           for k in range(len(shape))):
+                        diff[cell] += val
+                low = tuple(random.randrange(n) for n in shape)
+                high = tuple(random.randint(lo, n - 1)
+                             for lo, n in zip(low, shape))
+                self.assertEqual(F.box_sum(low, high), box(tab, low, high))
+                self.assertEqual(R.box_sum(low, high), box(diff, low, high))
+                self.assertEqual(G.get(low), diff[low])
+                self.assertEqual(R.get(high), diff[high])
 
     def test_fenwick_min(self):
         F = FenwickMin(1)
@@ -860,6 +1245,37 @@ t##
             # has a negative cycle
             weight = [[_, 9, _], [_, _, 5], [_, -6, _]]
             self.assertTrue(FW(weight))
+        _ = float('inf')
+        for block_size in [None, 1, 2, 3, 7]:
+            for _trial in range(10):
+                n = random.randint(1, 12)
+                weight = [[random.choice([_, _, random.randint(-2, 9)])
+                           for v in range(n)] for u in range(n)]
+                expected = [row[:] for row in weight]
+                cycle = floyd_warshall(expected)
+                self.assertEqual(floyd_warshall_vectorized(weight, block_size),
+                                 cycle)
+                if not cycle:
+                    self.assertEqual(weight, expected)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_floyd_warshall_numpy(self):
+        _ = float('inf')
+        for block_size in [None, 2]:
+            weight = [[_, _, -2, _],
+                      [4, _, 3, _],
+                      [_, _, _, 2],
+                      [_, -1, _, _]]
+            array = numpy.array(weight)     # float64, relaxed in place
+            self.assertFalse(floyd_warshall_vectorized(array, block_size))
+            self.assertEqual(array.tolist(), [[3, -1, -2, 0], [4, 3, 2, 4],
+                                              [5, 1, 3, 2], [3, -1, 1, 3]])
+            self.assertFalse(floyd_warshall_vectorized(weight, block_size))
+            self.assertEqual(weight, array.tolist())
+            self.assertTrue(all(isinstance(x, int) for row in weight
+                                for x in row))
+            array = numpy.array([[_, 9, _], [_, _, 5], [_, -6, _]])
+            self.assertTrue(floyd_warshall_vectorized(array, block_size))
 
     def test_gale_shapley(self):
         self.assertEqual(gale_shapley([[0, 1, 2], [2, 1, 0], [0, 2, 1]], [
@@ -907,6 +1323,72 @@ t##
         G.add_arc("a", "b", 1)
         self.assertEqual(G.weight[a][b], 1)
 
+    def test_read_graph(self):
+        fd, filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, 'w') as f:
+            f.write("# comment\n4 3\n0 1 5\n1 2 7\n3 1 2\n")
+        try:
+            graph, weight = read_graph(filename, weighted=True)
+            self.assertEqual(graph, [[1], [0, 2, 3], [1], [1]])
+            self.assertEqual(weight[1][3], 2)
+            self.assertEqual(weight[0][2], None)
+            self.assertEqual(weight[2][2], 0)
+            sparse = read_graph(filename, weighted=True,
+                                representation='listdict')
+            self.assertEqual(sparse, [{1: 5}, {0: 5, 2: 7, 3: 2}, {1: 7},
+                                      {1: 2}])
+            csr = read_graph(filename, weighted=True, representation='csr')
+            self.assertEqual(csr_to_listdict(csr), sparse)
+            self.assertEqual(read_graph(filename, directed=True),
+                             [[1], [2], [], [1]])
+            csr = read_graph(filename, directed=True, representation='csr')
+            self.assertEqual(csr_to_listdict(csr),
+                             [{1: None}, {2: None}, {}, {1: None}])
+            with open(filename, 'a') as f:
+                f.write("trailing data\n")
+            self.assertEqual(read_graph(filename, directed=True),
+                             [[1], [2], [], [1]])
+            with open(filename, 'w') as f:
+                f.write("4 3\n0 1\n1 2\n3 1\n")
+            self.assertEqual(read_graph(filename, directed=True),
+                             [[1], [2], [], [1]])
+            with self.assertRaises(ValueError):
+                read_graph(filename, weighted=True)
+            with open(filename, 'w') as f:
+                f.write("4 3\n0 1 5\n1 2 7\n")
+            with self.assertRaises(ValueError):
+                read_graph(filename)
+        finally:
+            os.remove(filename)
+        csr = arcs_to_csr(3, [2, 0, 2], [0, 1, 1], [4, 5, 6])
+        self.assertEqual(list(csr.offset), [0, 1, 1, 3])
+        self.assertEqual(list(csr.target), [1, 0, 1])
+        self.assertEqual(list(csr.weight), [5, 4, 6])
+
+    def test_graph_binary(self):
+        sparse = [{1: 4, 2: 1}, {3: 1}, {1: 2, 3: 5}, {}]
+        fd, filename = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        try:
+            for csr in [listdict_to_csr(sparse),
+                        listdict_to_csr([{v: 0.5 * w for v, w in adj.items()}
+                                         for adj in sparse]),
+                        listlist_and_matrix_to_csr([[1, 2], [3], [1, 3], []])]:
+                write_graph_binary(filename, csr)
+                mapped = open_graph_mmap(filename)
+                self.assertEqual(csr_to_listdict(mapped), csr_to_listdict(csr))
+                self.assertEqual(bfs(mapped, 0), bfs(csr, 0))
+                if csr.weight is not None:
+                    dist, _ = dijkstra(mapped, mapped, 0)
+                    self.assertEqual(dist, dijkstra(csr, csr, 0)[0])
+                    self.assertEqual(mapped.min_weight, min(csr.weight))
+            with open(filename, 'wb') as f:
+                f.write(b"4 3\n0 1\n1 2\n3 1\n" * 4)
+            with self.assertRaises(ValueError):
+                open_graph_mmap(filename)
+        finally:
+            os.remove(filename)
+
     def test_dist01(self):
         _ = None
         L_dir = [("reachable_cycle",
@@ -1010,6 +1492,23 @@ t##
         self.assertEqual(intervals_union([(1, 2), (0, 1)]), [(0, 2)])
         self.assertEqual(intervals_union([(2, 3), (0, 1)]), [(0, 1), (2, 3)])
 
+    def test_johnson(self):
+        n = 25
+        potential = [random.randint(0, 10) for _ in range(n)]
+        sparse = [{v: random.randint(0, 9) + potential[u] - potential[v]
+                   for v in range(n) if v != u and random.random() < 0.15}
+                  for u in range(n)]
+        graph, weight = listdict_to_listlist_and_matrix(sparse)
+        csr = listdict_to_csr(sparse)
+        expected = [(source, bellman_ford(sparse, sparse, source)[0])
+                    for source in range(n)]
+        for g, w in [(sparse, sparse), (graph, weight), (csr, csr)]:
+            self.assertEqual(list(johnson(g, w)), expected)
+        self.assertEqual(list(johnson(sparse, sparse, workers=2)), expected)
+        sparse = [{1: 2}, {2: -1}, {0: -2}]
+        with self.assertRaises(ValueError):
+            list(johnson(sparse, sparse))
+
     def test_knapsack(self):
         L = [([580, 1616, 1906, 1942, 50, 294],
               [874, 620, 345, 269, 360, 470], 2000, 1704),
@@ -1053,9 +1552,67 @@ t##
         sparse = [{1: 11, 2: 13, 3: 12}, {0: 11, 3: 14},
                   {0: 13, 3: 10}, {0: 12, 1: 14, 2: 10}]
         tree = [(2, 3), (0, 1), (0, 3)]
+        csr = listdict_to_csr(sparse)
         for graph, weight in [(sparse, sparse),
-                              listdict_to_listlist_and_matrix(sparse)]:
+                              listdict_to_listlist_and_matrix(sparse),
+                              (csr, csr)]:
             self.assertEqual(kruskal(graph, weight), tree)
+            for mst in [prim, boruvka, minimum_spanning_tree]:
+                self.assertEqual(set(map(frozenset, mst(graph, weight))),
+                                 set(map(frozenset, tree)))
+        self.assertEqual(len(boruvka(sparse, sparse, workers=2)), 3)
+        self.assertEqual(boruvka([], [], workers=2), [])
+        n = 200                             # several rounds
+        sparse = [{} for _ in range(n)]
+        for u in range(1, n):
+            for v in random.sample(range(u), min(u, 3)):
+                sparse[u][v] = sparse[v][u] = random.randint(0, 1000)
+        cost = sum(sparse[u][v] for u, v in kruskal(sparse, sparse))
+        tree = boruvka(sparse, sparse, workers=3)
+        self.assertEqual((len(tree), sum(sparse[u][v] for u, v in tree)),
+                         (n - 1, cost))
+        for _ in range(50):
+            n = random.randint(1, 12)
+            sparse = [{} for _ in range(n)]
+            for _ in range(random.randint(0, 30)):
+                u = random.randrange(n)
+                v = random.randrange(n)
+                if u != v:
+                    sparse[u][v] = sparse[v][u] = random.randint(0, 5)
+            forest = kruskal(sparse, sparse)
+            cost = sum(sparse[u][v] for u, v in forest)
+            for mst in [prim, boruvka, minimum_spanning_tree]:
+                tree = mst(sparse, sparse)
+                self.assertEqual(sum(sparse[u][v] for u, v in tree), cost)
+                self.assertEqual(len(tree), len(forest))
+                u_f = UnionFind(n)          # tree is acyclic
+                self.assertTrue(all(u_f.union(u, v) for u, v in tree))
+
+    def test_union_find(self):
+        uf = UnionFind(6)
+        self.assertEqual(uf.union_many([0, 2, 1, 4], [1, 3, 0, 0]),
+                         [True, True, False, True])
+        self.assertEqual(uf.nb_components, 3)
+        self.assertEqual([uf.size(x) for x in range(6)], [3, 3, 2, 2, 3, 1])
+        self.assertEqual(uf.labels(), [0, 0, 1, 1, 0, 2])
+        self.assertEqual(len(set(uf.find_many([0, 1, 4]))), 1)
+        n = 100000                      # long chain
+        uf = UnionFind(n)
+        for x in range(n - 1):
+            uf.up_bound[x] = x + 1
+        self.assertEqual(uf.find(0), n - 1)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_union_find_numpy(self):
+        uf = UnionFind(8)
+        merged = uf.union_many(numpy.array([0, 2, 4, 6, 1]),
+                               numpy.array([1, 3, 5, 7, 3]))
+        self.assertEqual(merged, [True] * 5)
+        roots = uf.find_many(numpy.arange(8))
+        self.assertIsInstance(roots, numpy.ndarray)
+        self.assertEqual(roots.tolist(), uf.find_many(range(8)))
+        self.assertEqual(len(set(roots[:4].tolist())), 1)
+        self.assertNotEqual(roots[0], roots[4])
 
     def test_knuth_morris_pratt(self):
         for match in [rabin_karp_matching, knuth_morris_pratt]:
@@ -1130,6 +1687,45 @@ t##
         self.assertEqual(kuhn_munkres_n3(
             [[5, 0, 1], [8, 5, 4]], 0), ([0, 1], 10))
 
+    def test_kuhn_munkres_vectorized(self):
+        self.assertEqual(kuhn_munkres_vectorized([[1]]), ([0], 1))
+        self.assertEqual(kuhn_munkres_vectorized([[]]), ([None], 0))
+        self.assertEqual(kuhn_munkres_vectorized([[1, 2, 3], [6, 5, 4]]),
+                         ([2, 0], 9))
+        self.assertEqual(kuhn_munkres_vectorized([[1, 6], [2, 5], [3, 4]]),
+                         ([1, None, 0], 9))
+        inf = float('inf')
+        self.assertEqual(kuhn_munkres_vectorized([[-inf, 1], [2, 9]]),
+                         ([1, 0], 3))
+        self.assertRaises(ValueError, kuhn_munkres_vectorized,
+                          [[-inf, 1], [-inf, 9]])
+        for _ in range(100):
+            nU = random.randint(1, 7)
+            nV = random.randint(1, 7)
+            G = [[random.randint(-20, 20) for v in range(nV)]
+                 for u in range(nU)]
+            mu, value = kuhn_munkres_vectorized(G)
+            matched = [v for v in mu if v is not None]
+            self.assertEqual(len(set(matched)), min(nU, nV))
+            self.assertEqual(value, sum(G[u][v] for u, v in enumerate(mu)
+                                        if v is not None))
+            if nU > nV:
+                G = [list(col) for col in zip(*G)]
+            self.assertEqual(value, kuhn_munkres_n3(G)[1])
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_kuhn_munkres_numpy(self):
+        inf = float('inf')
+        G = numpy.array([[-inf, 1], [2, 9]])
+        self.assertEqual(kuhn_munkres_vectorized(G), ([1, 0], 3))
+        for _ in range(50):
+            nU = random.randint(1, 7)
+            nV = random.randint(1, 7)
+            G = [[random.randint(-20, 20) for v in range(nV)]
+                 for u in range(nU)]
+            self.assertEqual(kuhn_munkres_vectorized(numpy.array(G)),
+                             kuhn_munkres_vectorized(G))
+
     def test_laser_mirrors(self):
         self.assertEqual(laser_mirrors(2, 2, [(0, 0), (0, 1),
                                               (1, 0), (1, 1)]), [1, 0, 1, 0])
@@ -1276,6 +1872,38 @@ t##
         y = range(1, 10, 2)
         self.assertEqual(merge(x, y), list(range(10)))
 
+    def test_min_cost_flow(self):
+        graph = [{1: 2, 2: 2}, {3: 2}, {3: 1}, {}]
+        cost = [{1: 5, 2: 1}, {3: 1}, {3: 1}, {}]
+        for scaling in [False, True]:
+            flow, value, total = min_cost_flow(graph, graph, cost, 0, 3,
+                                               scaling=scaling)
+            self.assertEqual((value, total), (3, 14))
+            self.assertEqual(flow[0], {1: 2, 2: 1})
+            _, value, total = min_cost_flow(graph, graph, cost, 0, 3, 1,
+                                            scaling)
+            self.assertEqual((value, total), (1, 2))
+        graph = [[1], [2], [1]]                 # negative circuit 1, 2
+        capacity = [[0, 4, 0], [0, 0, 5], [0, 2, 0]]
+        cost = [[0, 1, 0], [0, 0, -2], [0, 1, 0]]
+        flow, value, total = min_cost_flow(graph, capacity, cost, 0, 2)
+        self.assertEqual((value, total), (4, -5))
+        self.assertEqual(flow[1], {0: -4, 2: 4})
+        for _ in range(20):                     # assignments
+            n = random.randint(1, 8)
+            W = [[random.randint(0, 99) for j in range(n)] for i in range(n)]
+            graph = [{j + n: 1 for j in range(n)} for i in range(n)]
+            graph += [{2 * n + 1: 1} for j in range(n)]
+            graph += [{i: 1 for i in range(n)}, {}]
+            cost = [{j + n: -W[i][j] for j in range(n)} for i in range(n)]
+            cost += [{2 * n + 1: 0} for j in range(n)]
+            cost += [{i: 0 for i in range(n)}, {}]
+            for scaling in [False, True]:
+                _, value, total = min_cost_flow(graph, graph, cost, 2 * n,
+                                                2 * n + 1, scaling=scaling)
+                self.assertEqual(value, n)
+                self.assertEqual(-total, kuhn_munkres_n3(W)[1])
+
     def test_min_mean_cycle(self):
         W0 = [[None, -5, None, None],
               [None, None, -3, 0],
@@ -1550,6 +2178,29 @@ t##
             L[i] = (v, i)
         self.assertEqual(sorted(L), [Q.pop() for _ in L])
 
+    def test_indexed_heap(self):
+        for arity in [2, 3, 4, 8]:
+            n = 1000
+            keys = [random.randint(1, 100) for _ in range(n)]
+            Q = IndexedHeap(n, keys, arity)
+            for _ in range(300):
+                i = random.randint(0, n - 1)
+                keys[i] = random.randint(1, 100)
+                Q.update(i, keys[i])
+            popped = [Q.pop() for _ in range(n // 2)]
+            self.assertEqual([k for k, _ in popped], sorted(keys)[:n // 2])
+            for k, x in popped:
+                self.assertEqual(keys[x], k)
+                self.assertNotIn(x, Q)
+            Q = IndexedHeap(n, arity=arity)
+            self.assertEqual(len(Q), 0)
+            for x in range(0, n, 3):
+                Q.push(x, keys[x])
+            self.assertIn(3, Q)
+            self.assertNotIn(1, Q)
+            self.assertEqual([Q.pop()[0] for _ in range(len(Q))],
+                             sorted(keys[x] for x in range(0, n, 3)))
+
     def test_our_queue(self):
         q1 = deque()
         q2 = OurQueue()
@@ -1680,6 +2331,75 @@ t##
                     S[i] = k
                     T[i] = k
 
+    def test_segment_tree(self):
+        for L in [0, 1, 2, 5, 16, 33]:
+            T = [random.randint(-9, 9) for _ in range(L)]
+            S = SegmentTree(T, operator.add, 0,
+                            lambda f, x, size: x + f * size, operator.add, 0)
+            M = SegmentTree(T, min, float('inf'),
+                            lambda f, x, size: x if f is None else f,
+                            lambda f, g: g if f is None else f, None)
+            W = SegmentTree([str(x) for x in T], operator.add, '')
+            for _ in range(300):
+                i = random.randint(0, L)
+                k = random.randint(i, L)
+                val = random.randint(-9, 9)
+                op = random.randint(0, 3)
+                if op == 0:                 # add to a range
+                    S.update(i, k, val)
+                    T[i:k] = [x + val for x in T[i:k]]
+                    M.set_many(range(i, k), T[i:k])
+                    W.set_many(range(i, k), [str(x) for x in T[i:k]])
+                elif op == 1:               # set a range
+                    M.update(i, k, val)
+                    T[i:k] = [val] * (k - i)
+                    S.set_many(range(i, k), T[i:k])
+                    W.set_many(range(i, k), [str(x) for x in T[i:k]])
+                elif op == 2 and i < L:     # set an item
+                    S[i] = M[i] = T[i] = val
+                    W[i] = str(val)
+                self.assertEqual(S.query(i, k), sum(T[i:k]))
+                self.assertEqual(M.query(i, k),
+                                 min(T[i:k], default=float('inf')))
+                self.assertEqual(W.query(i, k), ''.join(map(str, T[i:k])))
+                if i < L:
+                    self.assertEqual(S[i], T[i])
+
+    def test_sparse_table(self):
+        for L in [0, 1, 2, 3, 17, 1023, 1024, 1025]:
+            T = [random.randint(1, 100) for _ in range(L)]
+            starts = [random.randint(0, L) for _ in range(300)]
+            ends = [random.randint(0, L) for _ in range(300)]
+            expected = [min(T[i:k], default=float('inf'))
+                        for i, k in zip(starts, ends)]
+            for RMQ in [SparseTable, BlockSparseTable]:
+                S = RMQ(T)
+                self.assertEqual([S.range_min(i, k)
+                                  for i, k in zip(starts, ends)], expected)
+                self.assertEqual(list(S.range_min_many(starts, ends)),
+                                 expected)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_sparse_table_numpy(self):
+        T = [random.randint(1, 100) for _ in range(100)]
+        S = SparseTable(T)
+        starts = numpy.array([random.randint(0, 100) for _ in range(300)])
+        ends = numpy.array([random.randint(0, 100) for _ in range(300)])
+        result = S.range_min_many(starts, ends)
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.tolist(),
+                         [min(T[i:k], default=float('inf'))
+                          for i, k in zip(starts.tolist(), ends.tolist())])
+        self.assertEqual(SparseTable([]).range_min_many([0, 0], [0, 0]),
+                         [float('inf')] * 2)
+        S = SparseTable([(0, 9), (1, 0), (2, 0)], (float('inf'), None))
+        self.assertEqual(S.range_min_many(numpy.array([0, 1, 2]),
+                                          numpy.array([3, 3, 2])),
+                         [(0, 9), (1, 0), (float('inf'), None)])
+        S = SparseTable([3, 1, 2], (float('inf'), None))
+        self.assertEqual(S.range_min_many([0, 2], [3, 2]),
+                         [1, (float('inf'), None)])
+
     def test_rectangles_from_grid(self):
         R = ["10110111",
              "01000101",
@@ -1809,6 +2529,35 @@ t##
             check(f, G, list(range(n)))
             G[-1].append(0)
             check(f, G, [0] * n)
+            check(f, listlist_and_matrix_to_csr(G), [0] * n)
+
+    def test_condensation(self):
+        graph = [[1], [2, 3, 4], [0, 3], [4], [3, 5], []]
+        comp, dag = condensation(graph)
+        self.assertEqual(list(comp), [0, 0, 0, 1, 1, 2])
+        self.assertEqual([list(dag[c]) for c in range(len(dag))],
+                         [[1], [2], []])
+        sparse = listlist_and_matrix_to_listdict(graph)
+        self.assertEqual(condensation(sparse)[0], comp)
+        n = 100000                          # deep graph
+        graph = [[u + 1] for u in range(n - 1)] + [[0]]
+        comp, dag = condensation(graph)
+        self.assertEqual((max(comp), len(dag)), (0, 1))
+        for _ in range(50):
+            n = random.randint(1, 15)
+            graph = [[random.randrange(n) for _ in range(random.randint(0, 3))]
+                     for _ in range(n)]
+            comp, dag = condensation(graph)
+            components = {frozenset(c) for c in tarjan(graph)}
+            self.assertEqual(len(dag), len(components))
+            for c in components:
+                self.assertEqual(len({comp[u] for u in c}), 1)
+            arcs = {(comp[u], comp[v]) for u in range(n) for v in graph[u]
+                    if comp[u] != comp[v]}
+            dag_arcs = [(c, d) for c in range(len(dag)) for d in dag[c]]
+            self.assertEqual(len(dag_arcs), len(arcs))
+            self.assertEqual(set(dag_arcs), arcs)
+            self.assertTrue(all(c < d for c, d in arcs))
 
     def test_subsetsum(self):
         L = [2, 4, 8, 16, 32]
@@ -1988,6 +2737,18 @@ t##
         self.assertEqual(Hld, Gld)
         Hll = matrix_to_listlist(W)
         self.assertEqual(Hll, Gll)
+        csr = listdict_to_csr(Gld)
+        self.assertEqual(len(csr), 4)
+        self.assertEqual(csr.nb_arcs(), 6)
+        self.assertEqual(list(csr.offset), [0, 1, 5, 5, 6])
+        self.assertEqual(list(csr[1]), [0, 1, 2, 3])
+        self.assertEqual(list(csr.weight), [7, 6, 1, 0, -1, 8])
+        self.assertEqual(csr_to_listdict(csr), Gld)
+        self.assertEqual(csr_to_listdict(matrix_to_csr(W)), Gld)
+        csr = listlist_and_matrix_to_csr(Gll)
+        self.assertIsNone(csr.weight)
+        self.assertEqual(csr_to_listdict(csr),
+                         listlist_and_matrix_to_listdict(Gll))
 
     def test_SortedSet(self):
         s1 = set()
@@ -6,7 +6,15 @@ Shortest Path algorithm A*.
 jill-jênn vie et christoph dürr - 2023
 """
 
+from array import array
 from heapq import heappop, heappush
+from tryalgo.dijkstra import dijkstra
+from tryalgo.graph import CSRGraph, reverse_csr
+
+try:
+    import numpy as np
+except ImportError:     # numpy is optional, used by Landmarks.lower_bound
+    np = None  # type: ignore
 
 
 def a_star(graph, start, lower_bound):
@@ -36,3 +44,158 @@ def a_star(graph, start, lower_bound):
                 heappush(Q, (val, y))
                 openset.add(y)
     return -1
+
+
+# snip{ a_star_weighted
+def a_star_weighted(graph, weight, source, target, lower_bound):
+    """single source single target shortest path by A* on a weighted graph
+
+       :param graph: directed graph in listlist, listdict or csr format
+       :param weight: in matrix format or same listdict or csr graph
+       :assumes: weights are non-negative
+       :param source: source vertex
+       :param target: target vertex
+       :param lower_bound: function mapping a vertex to a lower bound on
+                its distance to the target, for example obtained from
+                Landmarks.lower_bound
+       :returns: distance table, precedence table, as for dijkstra.
+                dist[target] is exact, other entries are upper bounds.
+       :complexity: `O(|V| + |E|log|V|)` for a consistent lower bound
+    """
+    if isinstance(weight, CSRGraph):
+        if weight.weight is None:
+            raise ValueError("a_star_weighted needs a weighted graph")
+        items = weight.items
+    else:
+        def items(u):
+            return ((v, weight[u][v]) for v in graph[u])
+    n = len(graph)
+    prec = [None] * n
+    dist = [float('inf')] * n
+    dist[source] = 0
+    heap = [(lower_bound(source), 0, source)]
+    while heap:
+        _, dist_node, node = heappop(heap)
+        if dist_node > dist[node]:
+            continue                    # outdated heap entry
+        if node == target:
+            break
+        for neighbor, weight_arc in items(node):
+            dist_neighbor = dist_node + weight_arc
+            if dist_neighbor < dist[neighbor]:  # can reopen a vertex
+                dist[neighbor] = dist_neighbor  # if lower_bound is
+                prec[neighbor] = node           # not consistent
+                heappush(heap, (dist_neighbor + lower_bound(neighbor),
+                                dist_neighbor, neighbor))
+    return dist, prec
+# snip}
+
+
+class Landmarks:
+    """Lower bounds on distances from the triangle inequality (ALT)
+
+    For every landmark L, and vertices v, t
+    dist(v, t) >= dist(L, t) - dist(L, v) and
+    dist(v, t) >= dist(v, L) - dist(t, L).
+
+    * landmarks: list of the chosen landmark vertices
+    * dist_from: dist_from[i][v] is the distance from the i-th landmark
+      to v, stored in an array of doubles
+    * dist_to: dist_to[i][v] is the distance from v to the i-th landmark
+    """
+    def __init__(self, graph, weight, landmarks):
+        """Builds the table with one dijkstra per landmark in each direction
+
+        :param graph: directed graph in listlist, listdict or csr format
+        :param weight: in matrix format or same listdict or csr graph
+        :param landmarks: list of landmark vertices, or their number k.
+            In the latter case, the landmarks are chosen greedily,
+            each one the farthest from the previous ones,
+            preferring vertices not connected to them
+        :complexity: `O(k (|V| + |E|log|V|))`
+        """
+        if isinstance(weight, CSRGraph):
+            rev = reverse_csr(weight)
+        else:
+            rev = [{} for _ in graph]
+            for u, _ in enumerate(graph):
+                for v in graph[u]:
+                    rev[v][u] = weight[u][v]
+        if isinstance(landmarks, int):
+            k, landmarks = landmarks, []
+        else:
+            k = len(landmarks)
+        self.landmarks = []
+        self.dist_from = []
+        self.dist_to = []
+        self._from_table = None         # numpy copies of shape (n, k),
+        self._to_table = None           # built by lower_bound
+        closest = [float('inf')] * len(graph)   # to chosen landmarks
+        while len(self.landmarks) < k:
+            if len(self.landmarks) < len(landmarks):
+                landmark = landmarks[len(self.landmarks)]
+            elif not self.landmarks:
+                landmark = 0
+            else:
+                landmark = max((v for v in range(len(graph))
+                                if v not in self.landmarks),
+                               key=closest.__getitem__)
+            self.landmarks.append(landmark)
+            self.dist_from.append(array('d', dijkstra(graph, weight,
+                                                      landmark)[0]))
+            self.dist_to.append(array('d', dijkstra(rev, rev, landmark)[0]))
+            for v, dist_v in enumerate(self.dist_from[-1]):
+                closest[v] = min(closest[v], dist_v, self.dist_to[-1][v])
+
+    def lower_bound(self, target):
+        """:returns: function mapping a vertex v to a lower bound on the
+        distance from v to target, or infinity if target is unreachable
+        from v
+        :complexity: with numpy, the bounds of all vertices are computed
+            at once as a vectorized max over an (n, k) table, then every
+            call is constant. Otherwise every call is O(k) for k landmarks
+        """
+        if np is not None and self.landmarks:
+            return self._lower_bound_table(target).__getitem__
+        inf = float('inf')
+        unreachable = []    # tables of landmarks reaching v but not target
+        terms = []          # (table, sign * value, sign), value finite
+        for dist_from, dist_to in zip(self.dist_from, self.dist_to):
+            if dist_from[target] < inf:
+                terms.append((dist_from, dist_from[target], 1))
+            else:
+                unreachable.append(dist_from)
+            if dist_to[target] < inf:
+                terms.append((dist_to, -dist_to[target], -1))
+
+        def bound(v):
+            for table in unreachable:
+                if table[v] < inf:
+                    return inf
+            best = 0
+            for table, value, sign in terms:
+                if table[v] < inf:
+                    best = max(best, value - sign * table[v])
+            return best
+        return bound
+
+    def _lower_bound_table(self, target):
+        """:returns: list of the lower bounds of all vertices"""
+        if self._from_table is None:
+            self._from_table = np.array(self.dist_from).T     # shape (n, k)
+            self._to_table = np.array(self.dist_to).T
+        dist_from, dist_to = self._from_table, self._to_table
+        from_target = dist_from[target]
+        to_target = dist_to[target]
+        known_from = np.isfinite(dist_from)
+        known_to = np.isfinite(dist_to)
+        with np.errstate(invalid='ignore'):
+            forward = np.where(known_from & np.isfinite(from_target),
+                               from_target - dist_from, 0)
+            backward = np.where(known_to & np.isfinite(to_target),
+                                dist_to - to_target, 0)
+        bound = np.maximum(forward.max(axis=1, initial=0),
+                           backward.max(axis=1, initial=0))
+        unreachable = (known_from & ~np.isfinite(from_target)).any(axis=1)
+        bound[unreachable] = np.inf
+        return bound.tolist()
@@ -6,21 +6,26 @@ Single source shortest paths by Bellman-Ford
 jill-jenn vie et christoph durr - 2014-2018
 """
 
+from collections import deque
+from tryalgo.graph import CSRGraph
+
 
 # snip{
 # pylint: disable=unused-variable
 def bellman_ford(graph, weight, source=0):
     """ Single source shortest paths by Bellman-Ford
 
-    :param graph: directed graph in listlist or listdict format
+    :param graph: directed graph in listlist, listdict or csr format
     :param weight: can be negative.
-                   in matrix format or same listdict graph
+                   in matrix format or same listdict or csr graph
     :returns: distance table, precedence table, bool
     :explanation: bool is True if a negative circuit is
                   reachable from the source, circuits
                   can have length 2.
     :complexity: `O(|V|*|E|)`
     """
+    if isinstance(weight, CSRGraph):
+        return _bellman_ford_csr(weight, source)
     n = len(graph)
     dist = [float('inf')] * n
     prec = [None] * n
@@ -40,12 +45,39 @@ def bellman_ford(graph, weight, source=0):
 # snip}
 
 
+def _bellman_ford_csr(graph, source):
+    """Bellman-Ford on a weighted graph in csr format,
+    iterating directly over the arc indices
+    """
+    n = len(graph)
+    offset = graph.offset
+    head = graph.target
+    weight = graph.weight
+    dist = [float('inf')] * n
+    prec = [None] * n
+    dist[source] = 0
+    for _ in range(n):
+        changed = False
+        for node in range(n):
+            dist_node = dist[node]
+            for arc in range(offset[node], offset[node + 1]):
+                alt = dist_node + weight[arc]
+                neighbor = head[arc]
+                if alt < dist[neighbor]:
+                    dist[neighbor] = alt
+                    prec[neighbor] = node
+                    changed = True
+        if not changed:
+            return dist, prec, False
+    return dist, prec, True
+
+
 def bellman_ford2(graph, weight, source):
     """ Single source shortest paths by Bellman-Ford
 
-    :param graph: directed graph in listlist or listdict format
+    :param graph: directed graph in listlist, listdict or csr format
     :param weight: can be negative.
-                   in matrix format or same listdict graph
+                   in matrix format or same listdict or csr graph
     :returns: distance table, precedence table, bool
     :explanation: bool is true if there is a negative cycle 
                   reachable from the source.
@@ -54,6 +86,12 @@ def bellman_ford2(graph, weight, source):
                   source to v of arbitrary small weight.
     :complexity: `O(|V|*|E|)`
     """
+    if isinstance(weight, CSRGraph):
+        arcs = weight.items
+    else:
+        def arcs(node):
+            return ((neighbor, weight[node][neighbor])
+                    for neighbor in graph[node])
     n = len(graph)
     dist = [float('inf')] * n
     prec = [None] * n
@@ -62,8 +100,8 @@ def bellman_ford2(graph, weight, source):
     def relax():
         for nb_iterations in  range(n-1):
             for node in range(n):
-                for neighbor in graph[node]:
-                    alt = dist[node] + weight[node][neighbor]
+                for neighbor, weight_arc in arcs(node):
+                    alt = dist[node] + weight_arc
                     if alt < dist[neighbor]:
                         dist[neighbor] = alt
                         prec[neighbor] = node
@@ -75,3 +113,80 @@ def bellman_ford2(graph, weight, source):
         if dist[node] < intermediate[node]:
             dist[node] = float('-inf')
     return dist, prec, min(dist) == float('-inf')
+
+
+# snip{ bellman_ford_queue
+def bellman_ford_queue(graph, weight, source=0):
+    """ Single source shortest paths by Bellman-Ford with a FIFO queue,
+    also known as SPFA. Only the out-arcs of vertices whose distance
+    changed are relaxed.
+
+    :param graph: directed graph in listlist, listdict or csr format
+    :param weight: can be negative.
+                   in matrix format or same listdict or csr graph
+    :param source: source vertex, or None for a virtual source
+                   with arcs of weight 0 to all vertices
+    :returns: distance table, precedence table, cycle
+    :explanation: cycle is None if no negative circuit is reachable
+                  from the source, otherwise it is the list of vertices
+                  of such a circuit, in order
+    :complexity: `O(|V|*|E|)` in the worst case,
+                 often much faster in practice
+    """
+    if isinstance(weight, CSRGraph):
+        arcs = weight.items
+    else:
+        def arcs(node):
+            return ((neighbor, weight[node][neighbor])
+                    for neighbor in graph[node])
+    n = len(graph)
+    prec = [None] * n
+    count = [0] * n                 # number of relaxations per vertex
+    if source is None:
+        dist = [0] * n
+        queue = deque(range(n))
+        in_queue = [True] * n
+    else:
+        dist = [float('inf')] * n
+        dist[source] = 0
+        queue = deque([source])
+        in_queue = [False] * n
+        in_queue[source] = True
+    while queue:
+        node = queue.popleft()
+        in_queue[node] = False
+        for neighbor, weight_arc in arcs(node):
+            alt = dist[node] + weight_arc
+            if alt < dist[neighbor]:
+                dist[neighbor] = alt
+                prec[neighbor] = node
+                count[neighbor] += 1
+                if count[neighbor] % n == 0:    # suspect negative circuit
+                    cycle = _prec_cycle(prec, neighbor)
+                    if cycle is not None:
+                        return dist, prec, cycle
+                if not in_queue[neighbor]:
+                    queue.append(neighbor)
+                    in_queue[neighbor] = True
+    return dist, prec, None
+# snip}
+
+
+def _prec_cycle(prec, node):
+    """Follows the precedence table from node.
+
+    :returns: list of vertices of the cycle reached, in order,
+              or None if the root is reached
+    """
+    seen = set()
+    while node is not None and node not in seen:
+        seen.add(node)
+        node = prec[node]
+    if node is None:
+        return None
+    cycle = [node]                  # node is on the cycle
+    u = prec[node]
+    while u != node:
+        cycle.append(u)
+        u = prec[u]
+    return cycle[::-1]
@@ -13,7 +13,7 @@ from collections import deque
 def bfs(graph, start=0):
     """Shortest path in unweighted graph by BFS
 
-       :param graph: directed graph in listlist or listdict format
+       :param graph: directed graph in listlist, listdict or csr format
        :param int start: source vertex
        :returns: distance table, precedence table
        :complexity: `O(|V|+|E|)`
@@ -6,7 +6,7 @@ Bipartie maximum matching
 jill-jenn vie et christoph durr - 2014-2018
 """
 
-__all__ = ["max_bipartite_matching"]
+__all__ = ["max_bipartite_matching", "hopcroft_karp"]
 
 
 
@@ -40,3 +40,66 @@ def max_bipartite_matching(bigraph):
         augment(u, bigraph, visit, u, match)
     return match
 # snip}
+
+
+# snip{ hopcroft_karp
+# pylint: disable=too-many-locals, too-many-branches
+def hopcroft_karp(bigraph):
+    """Bipartie maximum matching by Hopcroft-Karp
+
+    Each phase computes the layers of U by a BFS from the free vertices
+    in U, then augments along a maximal set of shortest augmenting paths,
+    found by iterative DFS.
+
+    :param bigraph: adjacency list, index = vertex in U,
+                                    value = neighbor list in V
+    :comment: U and V can have different cardinalities
+    :returns: matching list, match[v] == u iff (u, v) in matching
+    :complexity: `O(sqrt(|V|)*|E|)`
+    """
+    nU = len(bigraph)
+    nV = max((max(adjlist, default=-1) for adjlist in bigraph),
+             default=-1) + 1
+    adj = [list(adjlist) for adjlist in bigraph]
+    matchU = [None] * nU
+    matchV = [None] * nV
+    while True:
+        free = [u for u in range(nU) if matchU[u] is None]
+        layer = [-1] * nU           # BFS layers, -1 = not reached
+        for u in free:
+            layer[u] = 0
+        Q = free[:]
+        limit = None                # layer of the shortest paths
+        for u in Q:
+            if limit is not None and layer[u] >= limit:
+                break
+            for v in adj[u]:
+                w = matchV[v]
+                if w is None:
+                    limit = layer[u]
+                elif layer[w] < 0:
+                    layer[w] = layer[u] + 1
+                    Q.append(w)
+        if limit is None:           # no augmenting path
+            return matchV
+        current = [0] * nU          # current arc of every vertex in U
+        for root in free:
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                if current[u] == len(adj[u]):
+                    layer[u] = -1   # dead end
+                    stack.pop()
+                    continue
+                v = adj[u][current[u]]
+                current[u] += 1
+                w = matchV[v]
+                if w is None:       # augment along the stack
+                    for x in stack:
+                        y = adj[x][current[x] - 1]
+                        matchU[x] = y
+                        matchV[y] = x
+                    break
+                if layer[w] == layer[u] + 1:
+                    stack.append(w)
+# snip}
@@ -7,7 +7,7 @@ jill-jenn vie et christoph durr - 2014-2018
 """
 
 
-from tryalgo.bipartite_matching import max_bipartite_matching
+from tryalgo.bipartite_matching import hopcroft_karp
 
 
 def _alternate(u, bigraph, visitU, visitV, matchV):
@@ -15,11 +15,17 @@ def _alternate(u, bigraph, visitU, visitV, matchV):
       visitU, visitV marks all vertices covered by the tree.
     """
     visitU[u] = True
-    for v in bigraph[u]:
-        if not visitV[v]:
-            visitV[v] = True
-            assert matchV[v] is not None  # otherwise match is not maximum
-            _alternate(matchV[v], bigraph, visitU, visitV, matchV)
+    stack = [u]
+    while stack:
+        u = stack.pop()
+        for v in bigraph[u]:
+            if not visitV[v]:
+                visitV[v] = True
+                w = matchV[v]
+                assert w is not None  # otherwise match is not maximum
+                if not visitU[w]:
+                    visitU[w] = True
+                    stack.append(w)
 
 
 def bipartite_vertex_cover(bigraph):
@@ -32,10 +38,10 @@ def bipartite_vertex_cover(bigraph):
     :comment: selected vertices form a minimum vertex cover,
               i.e. every edge is adjacent to at least one selected vertex
               and number of selected vertices is minimum
-    :complexity: `O(|V|*|E|)`
+    :complexity: `O(sqrt(|V|)*|E|)`
     """
     V = range(len(bigraph))
-    matchV = max_bipartite_matching(bigraph)
+    matchV = hopcroft_karp(bigraph)
     matchU = [None for u in V]
     for v in V:                      # -- build the mapping from U to V
         if matchV[v] is not None:
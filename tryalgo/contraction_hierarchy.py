@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""\
+Shortest paths with contraction hierarchies
+
+The vertices are contracted one by one, in the order of increasing
+importance. Contracting v removes it from the graph and adds a shortcut
+(u, x) of weight w(u, v) + w(v, x) whenever u -> v -> x is the only
+shortest path between u and x. A query is then a bidirectional Dijkstra
+which only follows arcs towards more important vertices, and explores
+a tiny part of the graph.
+
+christoph dürr - jill-jênn vie - 2026
+"""
+
+from array import array
+from heapq import heappop, heappush
+import mmap
+import struct
+from tryalgo.graph import CSRGraph, arcs_to_csr, _binary_byteorder, \
+    _write_csr, _map_csr
+
+
+# The file of a hierarchy starts with a header of 24 bytes: the magic
+# string TRYALGOH, the format version, the byte order, 3 padding bytes
+# and n.
+_HIERARCHY_MAGIC = b'TRYALGOH'
+_HIERARCHY_VERSION = 1
+_HIERARCHY_HEADER = struct.Struct('=8sIc3xQ')
+
+
+# snip{
+# pylint: disable=too-many-locals
+class ContractionHierarchy:
+    """Contraction hierarchy of a weighted directed graph
+
+    * rank: rank[v] is the position of v in the contraction order
+    * up: csr graph of the arcs (u, v) with rank[u] < rank[v]
+    * down: csr graph of the arcs (v, u) such that (u, v) is an arc
+      with rank[u] > rank[v], used by the backward search
+    * up_middle, down_middle: for each arc of up and down,
+      the contracted vertex bypassed by the shortcut, or -1 for an
+      original arc
+    """
+    def __init__(self, graph, weight, witness_limit=500):
+        """Builds the hierarchy
+
+        :param graph: directed graph in listlist, listdict or csr format
+        :param weight: in matrix format or same listdict or csr graph
+        :param witness_limit: maximal number of vertices settled by a
+            witness search, smaller values give faster preprocessing
+            but more shortcuts
+        :assumes: weights are non-negative
+        :complexity: depends on the graph, typically
+            :math:`O(|V| \\log |V|)` witness searches on road networks
+        """
+        n = len(graph)
+        out = [{} for _ in range(n)]      # current remaining graph
+        inc = [{} for _ in range(n)]      # with incoming arcs
+        for u, v, w in _arcs(graph, weight):
+            assert w >= 0
+            if u != v and w < out[u].get(v, float('inf')):
+                out[u][v] = w
+                inc[v][u] = w
+        middle = {}                        # shortcut (u, x) -> v
+        deleted = [0] * n                  # contracted neighbors
+        self.rank = array('i', [0]) * n
+        up_arcs = ([], [], [], [])         # tail, head, weight, middle
+        down_arcs = ([], [], [], [])
+        heap = [(self._priority(out, inc, deleted, v, witness_limit), v)
+                for v in range(n)]
+        heap.sort()
+        order = 0
+        while heap:
+            _, v = heappop(heap)
+            priority = self._priority(out, inc, deleted, v, witness_limit)
+            if heap and priority > heap[0][0]:
+                heappush(heap, (priority, v))   # lazy update
+                continue
+            self.rank[v] = order
+            order += 1
+            for x, w in out[v].items():    # arcs to more important vertices
+                for table, value in zip(up_arcs,
+                                        (v, x, w, middle.get((v, x), -1))):
+                    table.append(value)
+                del inc[x][v]
+                deleted[x] += 1
+            for u, w in inc[v].items():
+                for table, value in zip(down_arcs,
+                                        (v, u, w, middle.get((u, v), -1))):
+                    table.append(value)
+                del out[u][v]
+                deleted[u] += 1
+            for u, x, w in _shortcuts(out, inc, v, witness_limit):
+                out[u][x] = w
+                inc[x][u] = w
+                middle[u, x] = v
+            out[v] = {}
+            inc[v] = {}
+        self.up = arcs_to_csr(n, *up_arcs[:3])
+        self.down = arcs_to_csr(n, *down_arcs[:3])
+        self.up_middle = _middle_table(n, up_arcs)
+        self.down_middle = _middle_table(n, down_arcs)
+
+    @staticmethod
+    def _priority(out, inc, deleted, v, witness_limit):
+        """Edge difference plus number of contracted neighbors"""
+        shortcuts = sum(1 for _ in _shortcuts(out, inc, v, witness_limit))
+        return shortcuts - len(out[v]) - len(inc[v]) + deleted[v]
+
+    def __len__(self):
+        return len(self.rank)
+
+    def query(self, source, target):
+        """Shortest path from source to target
+
+        :returns: distance, list of vertices of a shortest path,
+            or infinity, None if target is unreachable from source
+        :complexity: proportional to the search spaces in the hierarchy,
+            which are small on road networks
+        """
+        if source == target:
+            return 0, [source]
+        sides = (self.up, self.down)
+        dist = ({source: 0}, {target: 0})
+        prec = ({source: None}, {target: None})
+        black = (set(), set())
+        heap = ([(0, source)], [(0, target)])
+        best = float('inf')
+        meet = None
+        while True:
+            active = [side for side in (0, 1)
+                      if heap[side] and heap[side][0][0] < best]
+            if not active:
+                break
+            side = min(active, key=lambda s: heap[s][0][0])
+            dist_node, node = heappop(heap[side])
+            if node in black[side]:
+                continue
+            black[side].add(node)
+            if node in dist[1 - side] and \
+                    dist_node + dist[1 - side][node] < best:
+                best = dist_node + dist[1 - side][node]
+                meet = node
+            graph = sides[side]
+            here = dist[side]
+            for arc in graph.arcs(node):
+                neighbor = graph.target[arc]
+                alt = dist_node + graph.weight[arc]
+                if alt < here.get(neighbor, float('inf')):
+                    here[neighbor] = alt
+                    prec[side][neighbor] = (node, arc)
+                    heappush(heap[side], (alt, neighbor))
+        if meet is None:
+            return best, None
+        path = [meet]
+        node = meet
+        while prec[0][node] is not None:   # up arcs from source to meet
+            prev, arc = prec[0][node]
+            path[:0] = self._unpack(prev, node, self.up_middle[arc])[:-1]
+            node = prev
+        node = meet
+        while prec[1][node] is not None:   # down arcs from meet to target
+            prev, arc = prec[1][node]
+            path.extend(self._unpack(node, prev, self.down_middle[arc])[1:])
+            node = prev
+        return best, path
+
+    def _unpack(self, u, x, mid):
+        """:returns: original path from u to x, for the arc (u, x)
+        of the hierarchy bypassing mid, or -1 for an original arc
+        """
+        path = [u]
+        stack = [(x, mid)]   # remaining arcs of the path, in reverse order
+        while stack:
+            x, mid = stack.pop()
+            if mid == -1:
+                path.append(x)
+                u = x
+            else:            # mid has lower rank than u and x
+                stack.append((x, self._middle(self.up, self.up_middle,
+                                              mid, x)))
+                stack.append((mid, self._middle(self.down, self.down_middle,
+                                                mid, u)))
+        return path
+
+    @staticmethod
+    def _middle(graph, middle, u, v):
+        """:returns: middle of the arc from u to v in graph"""
+        for arc in graph.arcs(u):
+            if graph.target[arc] == v:
+                return middle[arc]
+        raise KeyError((u, v))
+
+    def save(self, filename):
+        """Writes the hierarchy into a binary file, which can be opened
+        with load. After a header follow the table rank and for up and
+        down the graph in the format of write_graph_binary and its table
+        of middles, all aligned to 8 bytes.
+        """
+        with open(filename, 'wb') as f:
+            f.write(_HIERARCHY_HEADER.pack(_HIERARCHY_MAGIC,
+                                           _HIERARCHY_VERSION,
+                                           _binary_byteorder(), len(self)))
+            array('i', self.rank).tofile(f)
+            for graph, middle in [(self.up, self.up_middle),
+                                  (self.down, self.down_middle)]:
+                f.write(bytes(-f.tell() % 8))
+                _write_csr(f, graph)
+                f.write(bytes(-f.tell() % 8))
+                array('i', middle).tofile(f)
+
+    @classmethod
+    def load(cls, filename):
+        """Maps a hierarchy written by save read-only into memory,
+        the tables are memoryviews on the mapped file
+
+        :raises ValueError: if the file is not in the expected format
+        :complexity: constant, pages are read on demand
+        """
+        with open(filename, 'rb') as f:
+            view = memoryview(mmap.mmap(f.fileno(), 0,
+                                        access=mmap.ACCESS_READ))
+        if len(view) < _HIERARCHY_HEADER.size:
+            raise ValueError("not a contraction hierarchy file")
+        magic, version, byteorder, n = _HIERARCHY_HEADER.unpack_from(view)
+        if magic != _HIERARCHY_MAGIC or version != _HIERARCHY_VERSION:
+            raise ValueError("not a contraction hierarchy file of version %d"
+                             % _HIERARCHY_VERSION)
+        if byteorder != _binary_byteorder():
+            raise ValueError("contraction hierarchy file has wrong byte "
+                             "order")
+        start = _HIERARCHY_HEADER.size
+        tables = [view[start:start + 4 * n].cast('i')]
+        start += 4 * n
+        for _ in range(2):
+            start += -start % 8
+            graph, start = _map_csr(view, start)
+            start += -start % 8
+            m = graph.nb_arcs()
+            if len(view) < start + 4 * m:
+                raise ValueError("contraction hierarchy file is truncated")
+            tables += [graph, view[start:start + 4 * m].cast('i')]
+            start += 4 * m
+        hierarchy = cls.__new__(cls)
+        hierarchy.rank, hierarchy.up, hierarchy.up_middle, \
+            hierarchy.down, hierarchy.down_middle = tables
+        return hierarchy
+# snip}
+
+
+def _arcs(graph, weight):
+    """iterates over the triplets (u, v, weight) of the arcs of the graph"""
+    if isinstance(weight, CSRGraph):
+        for u in range(len(weight)):
+            for arc in weight.arcs(u):
+                yield u, weight.target[arc], weight.weight[arc]
+    else:
+        for u, _ in enumerate(graph):
+            for v in graph[u]:
+                yield u, v, weight[u][v]
+
+
+def _shortcuts(out, inc, v, witness_limit):
+    """iterates over the shortcuts (u, x, weight) needed when contracting v
+
+    For each in-neighbor u, a Dijkstra from u avoiding v looks for
+    witness paths shorter than the paths through v.
+    """
+    if not out[v]:
+        return
+    max_out = max(out[v].values())
+    for u, w_uv in inc[v].items():
+        bound = w_uv + max_out
+        dist = {u: 0}
+        heap = [(0, u)]
+        settled = 0
+        while heap and settled < witness_limit:
+            dist_node, node = heappop(heap)
+            if dist_node > dist[node]:
+                continue
+            if dist_node > bound:
+                break
+            settled += 1
+            for neighbor, w in out[node].items():
+                alt = dist_node + w
+                if neighbor != v and alt < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = alt
+                    heappush(heap, (alt, neighbor))
+        for x, w_vx in out[v].items():
+            if x != u and dist.get(x, float('inf')) > w_uv + w_vx:
+                yield u, x, w_uv + w_vx
+
+
+def _middle_table(n, arcs):
+    """Orders the middles of the arcs like arcs_to_csr orders the arcs"""
+    tail, _, _, middle = arcs
+    return arcs_to_csr(n, tail, middle).target
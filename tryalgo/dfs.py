@@ -13,7 +13,7 @@ from . graph import Graph
 def dfs_recursive(graph: Graph, node: int, seen: List[bool]) -> None:
     """DFS, detect connected component, recursive implementation
 
-    :param graph: directed graph in listlist or listdict format
+    :param graph: directed graph in listlist, listdict or csr format
     :param int node: to start graph exploration
     :param boolean-table seen: will be set true for the connected component
           containing node.
@@ -30,7 +30,7 @@ def dfs_recursive(graph: Graph, node: int, seen: List[bool]) -> None:
 def dfs_iterative(graph: Graph, start: int, seen: List[bool]) -> None:
     """DFS, detect connected component, iterative implementation
 
-    :param graph: directed graph in listlist or listdict format
+    :param graph: directed graph in listlist, listdict or csr format
     :param int node: to start graph exploration
     :param boolean-table seen: will be set true for the connected component
           containing node.
@@ -49,7 +49,7 @@ def dfs_iterative(graph: Graph, start: int, seen: List[bool]) -> None:
 def dfs_tree(graph: Graph, start: int=0) -> List[Optional[int]]:
     """DFS, build DFS tree in unweighted graph
 
-       :param graph: directed graph in listlist or listdict format
+       :param graph: directed graph in listlist, listdict or csr format
        :param int start: source vertex
        :returns: precedence table
        :complexity: `O(|V|+|E|)`
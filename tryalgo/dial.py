@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""\
+Shortest paths in graphs with small non-negative integer weights
+
+Generalizations of dist01: a bucket queue (Dial's algorithm) for weights
+bounded by a small constant, and a radix heap for arbitrary integer weights.
+
+christoph dürr - jill-jênn vie - 2026
+"""
+
+from tryalgo.graph import CSRGraph
+from tryalgo.graph01 import dist01
+
+
+DIAL_MAX_WEIGHT = 64    # above, dijkstra_integer uses the radix heap
+
+
+# snip{
+def dial(graph, weight, source=0, target=None):
+    """Single source shortest paths by Dial's bucket queue
+
+    :param graph: directed graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
+    :assumes: weights are non-negative integers
+    :param int source: vertex
+    :param target: exploration stops once distance to target is found
+    :returns: distance table, predecessor table
+    :complexity: `O(|V| + |E| + D)`, where D is the largest finite
+                 distance, using `C + 1` buckets for maximal weight C
+    """
+    n = len(graph)
+    arcs = _arcs(graph, weight)
+    max_weight = max((w for u in range(n) for _, w in arcs(u)), default=0)
+    nb_buckets = max_weight + 1         # distances in the queue are in
+    bucket = [[] for _ in range(nb_buckets)]  # [d, d + max_weight]
+    dist = [float('inf')] * n
+    prec = [None] * n
+    black = [False] * n
+    dist[source] = 0
+    bucket[0].append(source)
+    pending = 1                         # number of vertices in buckets
+    d = 0                               # current distance
+    while pending:
+        current = bucket[d % nb_buckets]
+        while current:
+            node = current.pop()
+            pending -= 1
+            if black[node] or dist[node] != d:
+                continue                # outdated entry
+            black[node] = True
+            if node == target:
+                return dist, prec
+            for neighbor, weight_arc in arcs(node):
+                alt = d + weight_arc
+                if alt < dist[neighbor]:
+                    dist[neighbor] = alt
+                    prec[neighbor] = node
+                    bucket[alt % nb_buckets].append(neighbor)
+                    pending += 1
+        d += 1
+    return dist, prec
+# snip}
+
+
+# snip{ radix_heap
+def radix_dijkstra(graph, weight, source=0, target=None):
+    """Single source shortest paths by Dijkstra with a radix heap
+
+    The heap is monotone: a key in bucket i differs from the last popped
+    key first at bit i - 1. When bucket 0 is empty, the first non-empty
+    bucket is redistributed relatively to its minimum.
+
+    :param graph: directed graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
+    :assumes: weights are non-negative integers
+    :param int source: vertex
+    :param target: exploration stops once distance to target is found
+    :returns: distance table, predecessor table
+    :complexity: `O(|E| + |V| log C)`, for maximal weight C
+    """
+    n = len(graph)
+    arcs = _arcs(graph, weight)
+    dist = [float('inf')] * n
+    prec = [None] * n
+    black = [False] * n
+    dist[source] = 0
+    bucket = [[(0, source)]]
+    last = 0                            # last popped key
+    pending = 1
+    while pending:
+        if not bucket[0]:               # redistribute first non empty
+            i = 1
+            while not bucket[i]:
+                i += 1
+            items = bucket[i]
+            bucket[i] = []
+            last = min(items)[0]
+            for item in items:
+                bucket[(item[0] ^ last).bit_length()].append(item)
+        d, node = bucket[0].pop()
+        pending -= 1
+        if black[node] or dist[node] != d:
+            continue                    # outdated entry
+        black[node] = True
+        if node == target:
+            break
+        for neighbor, weight_arc in arcs(node):
+            alt = d + weight_arc
+            if alt < dist[neighbor]:
+                dist[neighbor] = alt
+                prec[neighbor] = node
+                i = (alt ^ last).bit_length()
+                while len(bucket) <= i:
+                    bucket.append([])
+                bucket[i].append((alt, neighbor))
+                pending += 1
+    return dist, prec
+# snip}
+
+
+def dijkstra_integer(graph, weight, source=0, target=None):
+    """Single source shortest paths for non-negative integer weights,
+    choosing the algorithm from the maximal weight C:
+    dist01 if C <= 1 and the graph is not in csr format,
+    dial if C <= DIAL_MAX_WEIGHT, else radix_dijkstra
+
+    :param graph: directed graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
+    :assumes: weights are non-negative integers
+    :param int source: vertex
+    :param target: exploration stops once distance to target is found
+    :returns: distance table, predecessor table
+    :complexity: `O(|V| + |E| + |V| min(C, log C))`
+    """
+    n = len(graph)
+    arcs = _arcs(graph, weight)
+    max_weight = 0
+    for u in range(n):
+        for _, weight_arc in arcs(u):
+            assert isinstance(weight_arc, int) and weight_arc >= 0
+            max_weight = max(max_weight, weight_arc)
+    if max_weight <= 1 and not isinstance(weight, CSRGraph):
+        return dist01(graph, weight, source, target)
+    if max_weight <= DIAL_MAX_WEIGHT:
+        return dial(graph, weight, source, target)
+    return radix_dijkstra(graph, weight, source, target)
+
+
+def _arcs(graph, weight):
+    """:returns: function mapping a vertex u to an iterator over the
+    pairs (v, weight) of the arcs (u, v)
+    """
+    if isinstance(weight, CSRGraph):
+        if weight.weight is None:
+            raise ValueError("a weighted graph is needed")
+        return weight.items
+
+    def arcs(u):
+        return ((v, weight[u][v]) for v in graph[u])
+    return arcs
@@ -8,7 +8,9 @@ jill-jênn vie et christoph dürr - 2015-2018
 # pylint: disable=wrong-import-position
 
 from heapq import heappop, heappush
-from tryalgo.our_heap import OurHeap
+from tryalgo.our_heap import IndexedHeap
+from tryalgo.graph import CSRGraph, reverse_csr
+from tryalgo.strongly_connected_components import reverse
 
 # snip{
 
@@ -16,8 +18,8 @@ from tryalgo.our_heap import OurHeap
 def dijkstra(graph, weight, source=0, target=None):
     """single source shortest paths by Dijkstra
 
-       :param graph: directed graph in listlist or listdict format
-       :param weight: in matrix format or same listdict graph
+       :param graph: directed graph in listlist, listdict or csr format
+       :param weight: in matrix format or same listdict or csr graph
        :assumes: weights are non-negative
        :param source: source vertex
        :type source: int
@@ -27,6 +29,8 @@ def dijkstra(graph, weight, source=0, target=None):
        :returns: distance table, precedence table
        :complexity: `O(|V| + |E|log|V|)`
     """
+    if isinstance(weight, CSRGraph):
+        return _dijkstra_csr(weight, source, target)
     n = len(graph)
     assert all(weight[u][v] >= 0 for u in range(n) for v in graph[u])
     prec = [None] * n
@@ -50,42 +54,180 @@ def dijkstra(graph, weight, source=0, target=None):
 # snip}
 
 
+def _dijkstra_csr(graph, source, target):
+    """Dijkstra on a weighted graph in csr format,
+    iterating directly over the arc indices
+    """
+    n = len(graph)
+    offset = graph.offset
+    head = graph.target
+    weight = graph.weight
+    if weight is None:
+        raise ValueError("dijkstra needs a weighted graph")
+    assert graph.min_weight >= 0
+    prec = [None] * n
+    black = [False] * n
+    dist = [float('inf')] * n
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        dist_node, node = heappop(heap)
+        if not black[node]:
+            black[node] = True
+            if node == target:
+                break
+            for arc in range(offset[node], offset[node + 1]):
+                neighbor = head[arc]
+                dist_neighbor = dist_node + weight[arc]
+                if dist_neighbor < dist[neighbor]:
+                    dist[neighbor] = dist_neighbor
+                    prec[neighbor] = node
+                    heappush(heap, (dist_neighbor, neighbor))
+    return dist, prec
+
+
 # snip{ dijkstra_update_heap
 
 
 # snip}
 
 # snip{ dijkstra_update_heap
-def dijkstra_update_heap(graph, weight, source=0, target=None):
+def dijkstra_update_heap(graph, weight, source=0, target=None, arity=4):
     """single source shortest paths by Dijkstra
        with a heap implementing item updates
 
-       :param graph: adjacency list or adjacency dictionary of a directed graph
-       :param weight: matrix or adjacency dictionary
+       :param graph: directed graph in listlist, listdict or csr format
+       :param weight: in matrix format or same listdict or csr graph
        :assumes: weights are non-negatif and weights are infinite for non edges
        :param source: source vertex
        :type source: int
        :param target: if given, stops once distance to target found
        :type target: int
+       :param arity: number of children per node in the heap
        :returns: distance table, precedence table
        :complexity: `O(|V| + |E|log|V|)`
     """
     n = len(graph)
-    assert all(weight[u][v] >= 0 for u in range(n) for v in graph[u])
+    if isinstance(weight, CSRGraph):
+        if weight.weight is None:
+            raise ValueError("dijkstra needs a weighted graph")
+        assert weight.min_weight >= 0
+        arcs = weight.items
+    else:
+        assert all(weight[u][v] >= 0 for u in range(n) for v in graph[u])
+
+        def arcs(node):
+            return ((neighbor, weight[node][neighbor])
+                    for neighbor in graph[node])
     prec = [None] * n
     dist = [float('inf')] * n
     dist[source] = 0
-    heap = OurHeap([(dist[node], node) for node in range(n)])
+    heap = IndexedHeap(n, dist, arity)    # built in linear time
     while heap:
         dist_node, node = heap.pop()       # Closest node from source
         if node == target:
             break
-        for neighbor in graph[node]:
-            old = dist[neighbor]
-            new = dist_node + weight[node][neighbor]
-            if new < old:
+        for neighbor, weight_arc in arcs(node):
+            new = dist_node + weight_arc
+            if new < dist[neighbor]:
                 dist[neighbor] = new
                 prec[neighbor] = node
-                heap.update((old, neighbor), (new, neighbor))
+                heap.update(neighbor, new)  # decrease key
     return dist, prec
 # snip}
+
+
+def bidirectional_dijkstra(graph, weight, source, target, reverse_graph=None):
+    """point to point shortest path by bidirectional Dijkstra
+
+       Alternates a forward search from the source and a backward search
+       from the target, always extending the search with the smaller
+       top of heap. Stops when the sum of both tops reaches the length
+       of the best path seen so far.
+
+       :param graph: directed graph in listlist, listdict or csr format
+       :param weight: in matrix format or same listdict or csr graph
+       :assumes: weights are non-negative
+       :param source: source vertex
+       :type source: int
+       :param target: target vertex
+       :type target: int
+       :param reverse_graph: optional reverse of graph, in listlist or
+                             listdict format, or in csr format with the
+                             weights if weight is a csr graph.
+                             Computed if not given.
+       :returns: distance from source to target, list of vertices of a
+                 shortest path, or infinity, None if target is unreachable
+       :complexity: `O(|V| + |E|log|V|)`, in practice explores a smaller
+                    part of the graph than dijkstra with a target
+    """
+    if isinstance(weight, CSRGraph):
+        if reverse_graph is None:
+            reverse_graph = reverse_csr(weight)
+        sides = [weight.items, reverse_graph.items]
+    else:
+        if reverse_graph is None:
+            reverse_graph = reverse(graph)
+        sides = [lambda u: ((v, weight[u][v]) for v in graph[u]),
+                 lambda v: ((u, weight[u][v]) for u in reverse_graph[v])]
+    n = len(graph)
+    dist = [[float('inf')] * n, [float('inf')] * n]
+    prec = [[None] * n, [None] * n]
+    black = [[False] * n, [False] * n]
+    heap = [[(0, source)], [(0, target)]]
+    dist[0][source] = 0
+    dist[1][target] = 0
+    best = 0 if source == target else float('inf')
+    meet = source
+    while heap[0] and heap[1] and heap[0][0][0] + heap[1][0][0] < best:
+        side = 0 if heap[0][0][0] <= heap[1][0][0] else 1
+        dist_node, node = heappop(heap[side])
+        if black[side][node]:
+            continue
+        black[side][node] = True
+        here, there = dist[side], dist[1 - side]
+        for neighbor, weight_arc in sides[side](node):
+            dist_neighbor = dist_node + weight_arc
+            if dist_neighbor < here[neighbor]:
+                here[neighbor] = dist_neighbor
+                prec[side][neighbor] = node
+                heappush(heap[side], (dist_neighbor, neighbor))
+                if dist_neighbor + there[neighbor] < best:
+                    best = dist_neighbor + there[neighbor]
+                    meet = neighbor
+    if best == float('inf'):
+        return best, None
+    path = []
+    node = meet
+    while node is not None:         # from meeting point back to source
+        path.append(node)
+        node = prec[0][node]
+    path.reverse()
+    node = prec[1][meet]
+    while node is not None:         # from meeting point on to target
+        path.append(node)
+        node = prec[1][node]
+    return best, path
+
+
+# pylint: disable=pointless-string-statement
+if __name__ == "__main__":
+    """
+    benchmark of heapq with lazy deletion against the indexed heap
+    """
+    from random import randint, seed
+    from time import perf_counter
+    seed(1)
+    N = 100000
+    SPARSE = [{randint(0, N - 1): randint(0, 100) for _ in range(8)}
+              for _ in range(N)]
+    for name, arity in [("heapq lazy deletion", None),
+                        ("indexed binary heap", 2),
+                        ("indexed 4-ary heap", 4),
+                        ("indexed 8-ary heap", 8)]:
+        start = perf_counter()
+        if arity is None:
+            dijkstra(SPARSE, SPARSE, 0)
+        else:
+            dijkstra_update_heap(SPARSE, SPARSE, 0, arity=arity)
+        print("%-20s %.2fs" % (name, perf_counter() - start))
@@ -6,7 +6,7 @@ Decompose DAG into a minimum number of chains
 jill-jenn vie et christoph durr - 2015-2018
 """
 
-from tryalgo.bipartite_matching import max_bipartite_matching
+from tryalgo.bipartite_matching import hopcroft_karp
 
 
 # snip{
@@ -19,7 +19,7 @@ def dilworth(graph):
     :complexity: same as matching
     """
     n = len(graph)
-    match = max_bipartite_matching(graph)  # maximum matching
+    match = hopcroft_karp(graph)           # maximum matching
     part = [None] * n                      # partition into chains
     nb_chains = 0
     for v in range(n - 1, -1, -1):         # in inverse topological order
@@ -8,7 +8,7 @@ jill-jênn vie et christoph dürr - 2015-2018
 
 from collections import deque
 from sys import setrecursionlimit
-from tryalgo.graph import add_reverse_arcs
+from tryalgo.graph import add_reverse_arcs, ResidualNetwork
 
 
 setrecursionlimit(5010)  # necessary for big graphs
@@ -71,3 +71,188 @@ def _dinic_step(graph, capacity, level, flow, u, target, limit):
         level[u] = None         # remove unreachable node
     return val
 # snip}
+
+
+# snip{ dinic_iterative
+def dinic_iterative(graph, capacity, source, target, stats=None):
+    """Maximum flow by Dinic, without recursion
+
+    The blocking flow of each phase is found by a depth first search
+    with an explicit stack of arcs. Every vertex keeps a pointer to its
+    current arc, which advances past saturated arcs and arcs leading to
+    dead ends, so each arc is scanned at most once per phase besides
+    the augmentations.
+
+    :param graph: directed graph in listlist or listdict format
+    :param capacity: in matrix format or same listdict graph
+    :param int source: vertex
+    :param int target: vertex
+    :param dict stats: if given, receives the counters 'phases',
+        'augmentations' and 'arcs_scanned'
+    :returns: skew symmetric flow in listdict format, flow value
+    :complexity: :math:`O(|V|^2 |E|)`
+    """
+    assert source != target
+    net = ResidualNetwork(graph, capacity)
+    if stats is not None:
+        stats.update(phases=0, augmentations=0, arcs_scanned=0)
+    total = _dinic_phases(net, source, target, float('inf'), stats)
+    return net.flow(), total
+
+
+# pylint: disable=too-many-locals, too-many-branches
+def _dinic_phases(net, source, target, limit, stats):
+    """Augments the flow in the residual network net by blocking flows,
+    until target is unreachable or the flow value reaches limit
+
+    :returns: value of the augmentation
+    """
+    head, residual, offset, arcs = net.head, net.residual, net.offset, \
+        net.arcs
+    n = len(net)
+    phases = augmentations = arcs_scanned = 0
+    total = 0
+    while total < limit:
+        level = [-1] * n            # build levels, -1 = inaccessible
+        level[source] = 0           # by BFS
+        Q = deque([source])
+        while Q and level[target] < 0:
+            u = Q.popleft()
+            arcs_scanned += offset[u + 1] - offset[u]
+            for i in range(offset[u], offset[u + 1]):
+                a = arcs[i]
+                v = head[a]
+                if level[v] < 0 and residual[a] > 0:
+                    level[v] = level[u] + 1
+                    Q.append(v)
+        if level[target] < 0:       # stop if sink is not reachable
+            break
+        phases += 1
+        current = offset[:-1]       # current arc of every vertex
+        path = []                   # arcs from source to u
+        u = source
+        while total < limit:
+            if u == target:         # augment along the path
+                delta = min(min(residual[a] for a in path), limit - total)
+                for a in path:
+                    residual[a] -= delta
+                    residual[a ^ 1] += delta
+                total += delta
+                augmentations += 1
+                k = 0               # retreat to the first saturated arc
+                while k < len(path) and residual[path[k]] > 0:
+                    k += 1
+                if k == len(path):  # limit reached
+                    break
+                u = head[path[k] ^ 1]
+                del path[k:]
+                continue
+            end = offset[u + 1]
+            i = current[u]
+            while i < end:          # advance to an admissible arc
+                a = arcs[i]
+                arcs_scanned += 1
+                if residual[a] > 0 and level[head[a]] == level[u] + 1:
+                    break
+                i += 1
+            current[u] = i
+            if i < end:             # advance
+                path.append(arcs[i])
+                u = head[arcs[i]]
+            elif u == source:       # blocking flow found
+                break
+            else:                   # dead end, retreat
+                level[u] = -1
+                a = path.pop()
+                u = head[a ^ 1]
+                current[u] += 1
+    if stats is not None:
+        stats['phases'] += phases
+        stats['augmentations'] += augmentations
+        stats['arcs_scanned'] += arcs_scanned
+    return total
+# snip}
+
+
+# snip{ incremental_max_flow
+class IncrementalMaxFlow:
+    """Maximum flow maintained under capacity changes
+
+    The residual network is kept between the changes. After capacity
+    increases the flow is only augmented further. After a decrease
+    below the current flow of an arc, the excess is first rerouted
+    around the arc, and what cannot be rerouted is pushed back to the
+    source, and pulled back from the target.
+    Changes are applied lazily, so several of them can be followed by a
+    single call to max_flow.
+
+    * stats: counters 'phases', 'augmentations' and 'arcs_scanned'
+      accumulated over all Dinic phases, including the repairs
+    """
+    def __init__(self, graph, capacity, source, target):
+        """:param graph: directed graph in listlist or listdict format
+        :param capacity: in matrix format or same listdict graph
+        :param int source: vertex
+        :param int target: vertex
+        :complexity: linear, the flow is computed by the first max_flow
+        """
+        assert source != target
+        self.net = ResidualNetwork(graph, capacity)
+        self.source = source
+        self.target = target
+        self.arc = {}                   # (u, v) -> index of the arc u->v
+        for a in range(0, len(self.net.head), 2):
+            self.arc[self.net.head[a + 1], self.net.head[a]] = a
+        self.value = 0
+        self.stale = True               # flow is maybe not maximum
+        self.stats = {'phases': 0, 'augmentations': 0, 'arcs_scanned': 0}
+
+    def capacity(self, u, v):
+        """:returns: current capacity of arc (u, v)"""
+        return self.net.capac[self.arc[u, v]]
+
+    def set_capacity(self, u, v, cap):
+        """Changes the capacity of the arc (u, v) of the graph
+
+        :raises KeyError: if (u, v) is not an arc of the graph
+        :complexity: proportional to the rerouted flow when the capacity
+            decreases below the flow on the arc, otherwise constant
+        """
+        net = self.net
+        a = self.arc[u, v]
+        flow = net.capac[a] - net.residual[a]
+        net.capac[a] = cap
+        net.residual[a] = cap - flow
+        self.stale = True
+        if flow > cap:                  # u has excess, v has deficit
+            excess = flow - cap
+            net.residual[a] = 0
+            net.residual[a ^ 1] -= excess
+            excess -= self._push(u, v, excess)       # reroute
+            if excess > 0:
+                if u != self.source:
+                    self._push(u, self.source, excess)
+                if v != self.target:
+                    self._push(self.target, v, excess)
+                self.value -= excess
+
+    def _push(self, u, v, limit):
+        """Pushes at most limit units from u to v in the residual network"""
+        if u == v:
+            return limit
+        return _dinic_phases(self.net, u, v, limit, self.stats)
+
+    def max_flow(self):
+        """:returns: the maximum flow value for the current capacities
+        :complexity: Dinic phases from the previous flow
+        """
+        if self.stale:
+            self.value += self._push(self.source, self.target, float('inf'))
+            self.stale = False
+        return self.value
+
+    def flow(self):
+        """:returns: skew symmetric maximum flow in listdict format"""
+        self.max_flow()
+        return self.net.flow()
+# snip}
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""\
+Offline dynamic connectivity
+
+Every edge is present during an interval of time. The intervals are
+stored in a segment tree over the queries, and a depth first traversal
+of the tree unites the edges of a node when entering it, and undoes
+these unions when leaving it, with a union-find supporting rollback.
+
+christoph dürr - jill-jênn vie - 2026
+"""
+
+from array import array
+
+
+# snip{
+class RollbackUnionFind:
+    """Maintains a partition of {0, ..., n-1}, such that the last unions
+    can be undone.
+    Union by rank without path compression, so every union changes
+    a constant number of entries, which are recorded in a history.
+    """
+    def __init__(self, n):
+        self.up_bound = array('i', range(n))
+        self.rank = array('i', [0]) * n
+        self.nb_components = n
+        self.history = []       # representatives attached by each union
+
+    def find(self, x_index):
+        """
+        :returns: identifier of part containing x_index
+        :complexity: O(log n)
+        """
+        up_bound = self.up_bound
+        while up_bound[x_index] != x_index:
+            x_index = up_bound[x_index]
+        return x_index
+
+    def union(self, x_index, y_index):
+        """
+        Merges part that contain x and part containing y
+        :returns: False if x_index, y_index are already in same part
+        :complexity: O(log n)
+        """
+        repr_x = self.find(x_index)
+        repr_y = self.find(y_index)
+        if repr_x == repr_y:       # already in the same component
+            return False
+        if self.rank[repr_x] < self.rank[repr_y]:
+            repr_x, repr_y = repr_y, repr_x
+        self.up_bound[repr_y] = repr_x
+        rank_increased = self.rank[repr_x] == self.rank[repr_y]
+        if rank_increased:
+            self.rank[repr_x] += 1
+        self.history.append((repr_y, rank_increased))
+        self.nb_components -= 1
+        return True
+
+    def checkpoint(self):
+        """:returns: a state to which rollback can return"""
+        return len(self.history)
+
+    def rollback(self, checkpoint):
+        """Undoes all unions made since the given checkpoint
+
+        :complexity: O(number of undone unions)
+        """
+        while len(self.history) > checkpoint:
+            repr_y, rank_increased = self.history.pop()
+            repr_x = self.up_bound[repr_y]
+            self.up_bound[repr_y] = repr_y
+            if rank_increased:
+                self.rank[repr_x] -= 1
+            self.nb_components += 1
+
+
+# pylint: disable=too-many-locals
+def dynamic_connectivity(n, operations):
+    """Answers connectivity queries on a graph with edge insertions
+    and deletions, knowing all operations in advance
+
+    :param n: number of vertices
+    :param operations: sequence of triplets (op, u, v), where op is
+        'add' to insert the edge (u, v), 'remove' to delete it, or
+        'query' to ask if u and v are connected at that moment.
+        An edge can be inserted several times.
+    :returns: list of booleans, the answers to the queries in order
+    :raises ValueError: if an edge is removed which is not present
+    :complexity: :math:`O((E + Q) \\log Q \\log n)` for E insertions
+        and Q queries
+    """
+    queries = []
+    intervals = []              # (first query, last query + 1, u, v)
+    present = {}                # edge -> start times of its copies
+    for op, u, v in operations:
+        edge = (min(u, v), max(u, v))
+        if op == 'add':
+            present.setdefault(edge, []).append(len(queries))
+        elif op == 'remove':
+            if not present.get(edge):
+                raise ValueError("edge %s is not present" % (edge,))
+            intervals.append((present[edge].pop(), len(queries)) + edge)
+        elif op == 'query':
+            queries.append(edge)
+        else:
+            raise ValueError("unknown operation %r" % op)
+    for edge, starts in present.items():
+        for start in starts:    # edges present until the end
+            intervals.append((start, len(queries)) + edge)
+    size = 1
+    while size < len(queries):
+        size *= 2
+    node_edges = [[] for _ in range(2 * size)]
+    for lo, hi, u, v in intervals:  # decompose [lo, hi) into tree nodes
+        lo += size
+        hi += size
+        while lo < hi:
+            if lo & 1:
+                node_edges[lo].append((u, v))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                node_edges[hi].append((u, v))
+            lo //= 2
+            hi //= 2
+    u_f = RollbackUnionFind(n)
+    answers = []
+    stack = [1] if queries else []  # node, or ~checkpoint to leave node
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            u_f.rollback(~node)
+            continue
+        checkpoint = u_f.checkpoint()
+        for u, v in node_edges[node]:
+            u_f.union(u, v)
+        if node >= size:            # leaf, query number node - size
+            if node - size < len(queries):
+                u, v = queries[node - size]
+                answers.append(u_f.find(u) == u_f.find(v))
+            u_f.rollback(checkpoint)
+        else:                       # visit left then right child
+            stack.append(~checkpoint)
+            stack.append(2 * node + 1)
+            stack.append(2 * node)
+    return answers
+# snip}
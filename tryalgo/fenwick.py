@@ -6,6 +6,11 @@ Fenwick tree
 jill-jenn vie et christoph durr - 2014-2018
 """
 
+try:
+    import numpy as np
+except ImportError:     # numpy is optional, used by Fenwick.prefix_sums
+    np = None  # type: ignore
+
 
 # snip{
 class Fenwick:
@@ -16,10 +21,27 @@ class Fenwick:
         of prefix sums in logarithmic time.
 
         :param array t: with numerical values
+        :complexity: linear
         """
-        self.s = [0] * (len(t) + 1)  # create internal storage
-        for a, v in enumerate(t):
-            self.add(a, v)           # initialize
+        self.s = [0]                 # create internal storage
+        self.s.extend(t)             # initialize in linear time
+        self._build()
+
+    def _build(self):
+        """transforms the table t stored in s[1:] into the tree"""
+        n = len(self.s) - 1
+        for i in range(1, n + 1):
+            j = i + (i & -i)         # parent
+            if j <= n:
+                self.s[j] += self.s[i]
+
+    def _unbuild(self):
+        """inverse of _build"""
+        n = len(self.s) - 1
+        for i in range(n, 0, -1):
+            j = i + (i & -i)
+            if j <= n:
+                self.s[j] -= self.s[i]
 
     # pylint: disable=redefined-builtin
     def prefixSum(self, a):
@@ -69,6 +91,78 @@ class Fenwick:
         return self.prefixSum(a)
 # snip}
 
+    # snip{ fenwick-batch
+    def _is_large(self, batch):
+        """a batch is large if it is worth a linear pass over the tree"""
+        return len(batch) * len(self.s).bit_length() > len(self.s)
+
+    def prefix_sums(self, indices):
+        """
+        :param indices: iterable or numpy array of indices in t
+        :returns: list of the prefix sums t[0] + ... + t[a] for every
+                  index a, or numpy array if indices is a numpy array
+        :complexity: O(min(k log n, n + k)) for k indices
+        """
+        if np is not None and isinstance(indices, np.ndarray):
+            if self._is_large(indices):
+                table = np.array(self._all_prefix_sums())
+                return table[indices + 1]
+            return np.array([self.prefixSum(a) for a in indices.tolist()])
+        indices = list(indices)
+        if self._is_large(indices):
+            table = self._all_prefix_sums()
+            return [table[a + 1] for a in indices]
+        return [self.prefixSum(a) for a in indices]
+
+    def _all_prefix_sums(self):
+        """:returns: table P with P[i] = t[0] + ... + t[i - 1]"""
+        table = self.s[:]
+        for i in range(1, len(table)):
+            table[i] += table[i - (i & -i)]     # left neighbor
+        return table
+
+    def add_many(self, indices, values):
+        """adds values[i] to t[indices[i]] for every i
+
+        :param indices, values: iterables or numpy arrays of same length
+        :complexity: O(min(k log n, n + k)) for k indices
+        """
+        if np is not None:
+            if isinstance(indices, np.ndarray):
+                indices = indices.tolist()
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+        indices = list(indices)
+        if self._is_large(indices):
+            self._unbuild()
+            for a, val in zip(indices, values):
+                self.s[a + 1] += val
+            self._build()
+        else:
+            for a, val in zip(indices, values):
+                self.add(a, val)
+
+    def lower_bound(self, value):
+        """
+        :param value: a prefix sum
+        :assumes: all values in t are non-negative
+        :returns: smallest index a with t[0] + ... + t[a] >= value,
+                  or len(t) if there is none
+        :complexity: O(log n)
+        """
+        tree = self.s
+        n = len(tree) - 1
+        i = 0                      # t[0] + ... + t[i - 1] < value
+        step = 1 << n.bit_length()
+        while step:
+            j = i + step
+            if j <= n and tree[j] < value:
+                i = j
+                value -= tree[j]
+            step >>= 1
+        return i
+    # snip}
+
 class FenwickMin:
     """maintains a tree to allow quick updates and queries
     of a virtual table t
@@ -103,3 +197,202 @@ class FenwickMin:
         while i < len(self.s):     # loops over parents
             self.s[i] = min(self.s[i], val)       # update node
             i += (i & -i)          # parent
+
+
+# snip{ fenwick-nd
+class FenwickND:
+    """maintains a tree to allow quick updates and queries
+    of box sums in a d-dimensional table t, stored in a single flat list
+    """
+    def __init__(self, shape, t=None):
+        """
+        :param shape: tuple (n_1, ..., n_d) of the dimensions of t
+        :param t: optional nested lists of depth d with numerical values,
+                  initially t is all zero
+        :complexity: O(d n_1 ... n_d)
+        """
+        self.shape = tuple(shape)
+        self.stride = []            # internal indices start at 1
+        size = 1
+        for n in reversed(self.shape):
+            self.stride.append(size)
+            size *= n + 1
+        self.stride.reverse()
+        self.s = [0] * size
+        if t is not None:
+            self._fill(t, 0, 0)
+            for stride, n in zip(self.stride, self.shape):
+                for pos in range(size):   # increasing along each line
+                    i = pos // stride % (n + 1)
+                    j = i + (i & -i)      # parent
+                    if 0 < i and j <= n:
+                        self.s[pos + (j - i) * stride] += self.s[pos]
+
+    def _fill(self, t, dim, pos):
+        """copies the nested lists t into s, without the tree structure"""
+        for i, ti in enumerate(t, 1):
+            if dim + 1 == len(self.shape):
+                self.s[pos + i * self.stride[dim]] = ti
+            else:
+                self._fill(ti, dim + 1, pos + i * self.stride[dim])
+
+    def _up(self, index):
+        """:returns: positions in s of the nodes containing index"""
+        positions = [0]
+        for i, stride, n in zip(index, self.stride, self.shape):
+            chain = []
+            i += 1
+            while i <= n:               # loops over parents
+                chain.append(i * stride)
+                i += (i & -i)
+            positions = [p + c for p in positions for c in chain]
+        return positions
+
+    def _down(self, index):
+        """:returns: positions in s of the nodes covering the box from
+        the origin to index"""
+        positions = [0]
+        for i, stride in zip(index, self.stride):
+            chain = []
+            i += 1
+            while i > 0:                # loops over neighbors
+                chain.append(i * stride)
+                i -= (i & -i)
+            positions = [p + c for p in positions for c in chain]
+        return positions
+
+    def add(self, index, val):
+        """
+        :param index: tuple of indices in t
+        :modifies: adds val to t[index]
+        :complexity: O(log n_1 ... log n_d)
+        """
+        for p in self._up(index):
+            self.s[p] += val
+
+    def prefix_sum(self, index):
+        """
+        :param index: tuple of indices in t, a negative index returns 0
+        :returns: sum of t over the box from (0, ..., 0) to index
+        :complexity: O(log n_1 ... log n_d)
+        """
+        return sum(self.s[p] for p in self._down(index))
+
+    def box_sum(self, low, high):
+        """
+        :param low, high: tuples of indices with low <= high
+        :returns: sum of t over the box from low to high included
+        :complexity: O(2^d log n_1 ... log n_d)
+        """
+        total = 0
+        for corner, sign in _corners(low, high, -1):
+            total += sign * self.prefix_sum(corner)
+        return total
+
+    # variante:
+    def box_add(self, low, high, val):
+        """Variant, adds val to t over the box from low to high included.
+        Then get(index) reads t[index], while prefix_sum and box_sum
+        must not be used.
+
+        :complexity: O(2^d log n_1 ... log n_d)
+        """
+        for corner, sign in _corners(low, high, +1):
+            self.add(corner, sign * val)
+
+    def get(self, index):
+        """Variant, reads t[index] after box_add updates"""
+        return self.prefix_sum(index)
+
+
+class FenwickNDRange(FenwickND):
+    """maintains trees to allow additions over boxes and queries of box
+    sums in a d-dimensional table t, initially all zero.
+
+    Additions over boxes are stored as a difference table D, for which
+    the sum of t from the origin to x is the sum over p <= x of
+    D[p] (x_1 - p_1 + 1) ... (x_d - p_d + 1). Expanding the product,
+    one tree per subset S of the dimensions accumulates D[p] times the
+    product of p_k for k in S. The 2^d trees are interleaved in the flat
+    list, each node storing 2^d consecutive values.
+    """
+    def __init__(self, shape):
+        """
+        :param shape: tuple (n_1, ..., n_d) of the dimensions of t
+        """
+        super().__init__(shape)
+        self.width = 1 << len(self.shape)
+        self.s = [0] * (len(self.s) * self.width)
+
+    def add(self, index, val):
+        """
+        :modifies: adds val to t[index]
+        :complexity: O(2^d log n_1 ... log n_d)
+        """
+        self.box_add(index, index, val)
+
+    def _add_difference(self, index, val):
+        """adds val to D[index] in the 2^d trees"""
+        coef = [val] * self.width
+        for subset in range(self.width):
+            for k, i in enumerate(index):
+                if subset >> k & 1:
+                    coef[subset] *= i
+        for p in self._up(index):
+            p *= self.width
+            for subset in range(self.width):
+                self.s[p + subset] += coef[subset]
+
+    def box_add(self, low, high, val):
+        """adds val to t over the box from low to high included
+
+        :complexity: O(4^d log n_1 ... log n_d)
+        """
+        for corner, sign in _corners(low, high, +1):
+            self._add_difference(corner, sign * val)
+
+    def prefix_sum(self, index):
+        """
+        :param index: tuple of indices in t, a negative index returns 0
+        :returns: sum of t over the box from (0, ..., 0) to index
+        :complexity: O(2^d log n_1 ... log n_d)
+        """
+        sums = [0] * self.width
+        for p in self._down(index):
+            p *= self.width
+            for subset in range(self.width):
+                sums[subset] += self.s[p + subset]
+        total = 0
+        for subset in range(self.width):
+            term = sums[subset]
+            for k, i in enumerate(index):
+                if subset >> k & 1:
+                    term = -term
+                else:
+                    term *= i + 1
+            total += term
+        return total
+
+    def get(self, index):
+        """reads t[index]"""
+        return self.box_sum(index, index)
+
+
+def _corners(low, high, side):
+    """iterates over the 2^d corners of the box from low to high,
+    with their inclusion-exclusion signs. Along each dimension the
+    corner coordinate is high or low - 1 for side = -1,
+    and low or high + 1 for side = +1.
+    """
+    d = len(low)
+    for mask in range(1 << d):
+        corner = []
+        sign = 1
+        for k in range(d):
+            if mask >> k & 1:
+                corner.append(low[k] - 1 if side < 0 else high[k] + 1)
+                sign = -sign
+            else:
+                corner.append(high[k] if side < 0 else low[k])
+        yield tuple(corner), sign
+# snip}
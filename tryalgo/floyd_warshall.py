@@ -6,6 +6,11 @@ All pairs shortest paths by Floyd-Warshall
 jill-jênn vie, christoph dürr et pascal ortiz - 2014-2019
 """
 
+try:
+    import numpy as np
+except ImportError:     # numpy is optional, used by floyd_warshall_vectorized
+    np = None  # type: ignore
+
 
 # snip{
 def floyd_warshall(weight):
@@ -48,3 +53,94 @@ def floyd_warshall2(weight):
         if Wv[v] < 0:      # negative cycle found
             return True
     return False
+
+
+def floyd_warshall_vectorized(weight, block_size=None):
+    """All pairs shortest paths by Floyd-Warshall,
+    relaxing whole rows at once.
+
+    If numpy is installed, the k-th relaxation is
+    D = minimum(D, D[:, k] + D[k, :]) on a float64 array,
+    otherwise each row is recomputed by a list comprehension.
+    With block_size, the matrix is processed in square tiles of this size,
+    such that the three tiles involved in a relaxation fit in the cache.
+
+    :param weight: edge weight matrix, list of lists or numpy array,
+                   float('inf') for missing arcs
+    :param block_size: optional tile size for the blocked variant
+    :modifies: weight matrix to contain distances in graph.
+               With numpy, the values are computed in float64, and
+               converted back to int if all finite entries were int.
+    :returns: True if there are negative cycles
+    :complexity: :math:`O(|V|^3)`
+    """
+    n = len(weight)
+    blocks = [range(n)] if block_size is None else \
+        [range(i, min(i + block_size, n)) for i in range(0, n, block_size)]
+    if np is None:
+        _relax_blocks(weight, blocks, _relax_lists)
+        return any(weight[v][v] < 0 for v in range(n))
+    if isinstance(weight, np.ndarray) and weight.dtype.kind == 'f':
+        dist = weight             # work in place
+    else:
+        dist = np.array(weight, dtype=np.float64).reshape(n, n)
+    _relax_blocks(dist, blocks, _relax_array)
+    if dist is not weight:        # copy back into the given matrix
+        if isinstance(weight, np.ndarray):
+            weight[...] = dist
+        else:
+            integral = all(isinstance(x, int) for row in weight
+                           for x in row if x not in (float('inf'),
+                                                     float('-inf')))
+            for u, row in enumerate(dist.tolist()):
+                if integral:
+                    row = [int(x) if np.isfinite(x) else x for x in row]
+                weight[u][:] = row
+    return bool((np.diagonal(dist) < 0).any())
+
+
+def _relax_blocks(dist, blocks, relax):
+    """Blocked Floyd-Warshall: for each diagonal tile mids, first relax
+    mids itself, then the tiles in its row and its column, then the others.
+    With a single block this is the usual algorithm.
+    """
+    for mids in blocks:
+        relax(dist, mids, mids, mids)
+        for cols in blocks:
+            if cols is not mids:
+                relax(dist, mids, cols, mids)
+        for rows in blocks:
+            if rows is not mids:
+                relax(dist, rows, mids, mids)
+        for rows in blocks:
+            if rows is not mids:
+                for cols in blocks:
+                    if cols is not mids:
+                        relax(dist, rows, cols, mids)
+
+
+def _relax_lists(dist, rows, cols, mids):
+    """D[u][v] = min(D[u][v], D[u][k] + D[k][v]) for u in rows, v in cols,
+    k in mids, on a list of lists, row slice by row slice
+    """
+    col_slice = slice(cols.start, cols.stop)
+    inf = float('inf')
+    for k in mids:
+        Dk = dist[k][col_slice]
+        for u in rows:
+            Du = dist[u]
+            d = Du[k]
+            if d == inf:
+                continue          # nothing to relax through k
+            Du[col_slice] = [a if a <= d + b else d + b
+                             for a, b in zip(Du[col_slice], Dk)]
+
+
+def _relax_array(dist, rows, cols, mids):
+    """Same on a numpy array, the relaxation for one k is vectorized"""
+    row_slice = slice(rows.start, rows.stop)
+    col_slice = slice(cols.start, cols.stop)
+    tile = dist[row_slice, col_slice]   # a view, modified in place
+    for k in mids:
+        np.minimum(tile, dist[row_slice, k, None] + dist[None, k, col_slice],
+                   out=tile)
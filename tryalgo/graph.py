@@ -9,6 +9,10 @@ jill-jênn vie et christoph dürr - 2015-2019
 # pylint: disable=dangerous-default-value, too-many-locals, too-many-branches
 
 # from __future__ import annotations
+from array import array
+import mmap
+import struct
+import sys
 from typing import List, Dict, Union, Any
 
 def readval(file, ty):
@@ -33,7 +37,8 @@ def readtab(fi, ty):
 
 
 # pylint: disable=no-else-return
-def read_graph(filename, directed=False, weighted=False, default_weight=None):
+def read_graph(filename, directed=False, weighted=False, default_weight=None,
+               representation='listlist'):
     """Read a graph from a text file
 
     :param filename: plain text file. All numbers are separated by space.
@@ -44,37 +49,71 @@ def read_graph(filename, directed=False, weighted=False, default_weight=None):
         Line for weighted edge u,v contains three integers u, v, w[u,v].
     :param directed: true for a directed graph, false for undirected
     :param weighted: true for an edge weighted graph
-    :returns: graph in listlist format, possibly followed by weight matrix
-    :complexity: O(n + m) for unweighted graph,
-                 :math:`O(n^2)` for weighted graph
+    :param representation: 'listlist' for a graph in listlist format,
+        possibly followed by a weight matrix, 'listdict' for a graph in
+        listdict format, where weights are None if unweighted,
+        or 'csr' for a CSRGraph
+    :returns: graph in the requested representation
+    :raises ValueError: if the edge lines are missing columns or values
+    :complexity: O(n + m), except :math:`O(n^2)` for weighted graph
+        in listlist representation
     """
+    assert representation in ('listlist', 'listdict', 'csr')
     with open(filename, 'r') as f:
         while True:
             line = f.readline()         # ignore leading comments
             if line[0] != '#':
                 break
         nb_nodes, nb_edges = tuple(map(int, line.split()))
-        graph = [[] for u in range(nb_nodes)]
+        values = list(map(int, f.readline().split()))   # first edge
+        width = len(values)             # number of columns
+        rest = width * max(nb_edges - 1, 0)     # ignore trailing data
+        values += map(int, f.read().split(maxsplit=rest)[:rest])
+    if nb_edges == 0:
+        width = 3 if weighted else 2
+    if width < (3 if weighted else 2) or len(values) < width * nb_edges:
+        raise ValueError("expected %i edges with %s per line in %s" %
+                         (nb_edges, "u v w" if weighted else "u v",
+                          filename))
+    # si le fichier contient des poids, ils seront ignorés
+    tail = values[0:width * nb_edges:width]
+    head = values[1:width * nb_edges:width]
+    weight = values[2:width * nb_edges:width] if weighted else None
+    if not directed:                    # each edge gives two opposite arcs
+        tail, head = _interleave(tail, head), _interleave(head, tail)
         if weighted:
-            weight = [[default_weight] * nb_nodes for v in range(nb_nodes)]
-            for v in range(nb_nodes):
-                weight[v][v] = 0
-            for _ in range(nb_edges):
-                u, v, w = readtab(f, int)
-                graph[u].append(v)
-                weight[u][v] = w
-                if not directed:
-                    graph[v].append(u)
-                    weight[v][u] = w
-            return graph, weight
+            weight = _interleave(weight, weight)
+    if representation == 'csr':
+        return arcs_to_csr(nb_nodes, tail, head, weight)
+    if representation == 'listdict':
+        sparse = [{} for u in range(nb_nodes)]
+        if weighted:
+            for u, v, w in zip(tail, head, weight):
+                sparse[u][v] = w
         else:
-            for _ in range(nb_edges):
-                # si le fichier contient des poids, ils seront ignorés
-                u, v = readtab(f, int)[:2]
-                graph[u].append(v)
-                if not directed:
-                    graph[v].append(u)
-            return graph
+            for u, v in zip(tail, head):
+                sparse[u][v] = None
+        return sparse
+    graph = [[] for u in range(nb_nodes)]
+    for u, v in zip(tail, head):
+        graph[u].append(v)
+    if weighted:
+        matrix = [[default_weight] * nb_nodes for v in range(nb_nodes)]
+        for v in range(nb_nodes):
+            matrix[v][v] = 0
+        for u, v, w in zip(tail, head, weight):
+            matrix[u][v] = w
+        return graph, matrix
+    else:
+        return graph
+
+
+def _interleave(first, second):
+    """:returns: list first[0], second[0], first[1], second[1], ..."""
+    result = [None] * (2 * len(first))
+    result[0::2] = first
+    result[1::2] = second
+    return result
 
 
 # pylint: disable=too-many-arguments, singleton-comparison
@@ -209,6 +248,68 @@ def add_reverse_arcs(graph, capac=None):
                     graph[v][u] = 0
 # snip}
 
+
+# snip{ residual_network
+class ResidualNetwork:
+    """Flow network stored arc by arc, for flow algorithms on large graphs.
+    Arc 2e goes from u to v for the e-th arc (u, v) of the given graph,
+    arc 2e + 1 is its reverse arc, from v to u, so the reverse of arc a is
+    a ^ 1. The graph given as argument is not modified.
+
+    * head: head[a] is the vertex arc a points to
+    * capac: capac[a] is the capacity of arc a, 0 for reverse arcs
+    * residual: residual[a] is the residual capacity of arc a,
+      initially the flow is zero
+    * offset, arcs: the arcs leaving u are arcs[offset[u]:offset[u + 1]]
+    * cost: if costs are given, cost[a] is the cost of arc a,
+      and the opposite for reverse arcs
+    """
+    def __init__(self, graph, capacity, cost=None):
+        """:param graph: directed graph in listlist or listdict format
+        :param capacity: in matrix format or same listdict graph
+        :param cost: optional, in matrix format or same listdict graph
+        :complexity: linear
+        """
+        n = len(graph)
+        self.head = []
+        self.capac = []
+        self.cost = None if cost is None else []
+        tail = []
+        for u in range(n):
+            for v in graph[u]:
+                self.head += [v, u]
+                self.capac += [capacity[u][v], 0]
+                if cost is not None:
+                    self.cost += [cost[u][v], -cost[u][v]]
+                tail += [u, v]
+        self.residual = self.capac[:]
+        self.offset = [0] * (n + 1)
+        for u in tail:                      # counting sort by tail
+            self.offset[u + 1] += 1
+        for u in range(n):
+            self.offset[u + 1] += self.offset[u]
+        free = self.offset[:-1]
+        self.arcs = [0] * len(tail)
+        for a, u in enumerate(tail):
+            self.arcs[free[u]] = a
+            free[u] += 1
+
+    def __len__(self):
+        return len(self.offset) - 1
+
+    def flow(self):
+        """:returns: skew symmetric flow in listdict format,
+        flow[u][v] is the net flow from u to v
+        """
+        result = [{} for _ in range(len(self))]
+        for a in range(0, len(self.head), 2):
+            u, v = self.head[a + 1], self.head[a]
+            amount = self.capac[a] - self.residual[a]
+            result[u][v] = result[u].get(v, 0) + amount
+            result[v][u] = result[v].get(u, 0) - amount
+        return result
+# snip}
+
 # -----------------------------------------------------------------------------
 # transformations between different graph representations
 
@@ -307,6 +408,287 @@ def dictdict_to_listdict(dictgraph):
             sparse[name_to_node[u]][name_to_node[v]] = dictgraph[u][v]
     return sparse, name_to_node, node_to_name
 
+# -----------------------------------------------------------------------------
+# compressed sparse row representation
+
+# csr is a compact adjacency list stored in three flat arrays.
+#        The arcs leaving u have the indices offset[u] to offset[u + 1] - 1,
+#        arc a goes to vertex target[a] and has weight weight[a].
+
+
+# snip{ class_csr_graph
+class CSRGraph:
+    """Directed graph in compressed sparse row (csr) format
+
+    * offset: table of size n + 1, the arcs leaving u are indexed
+      from offset[u] to offset[u + 1] - 1
+    * target: table of size m, target[a] is the head of arc a
+    * weight: table of size m, weight[a] is the weight of arc a,
+      or None for an unweighted graph
+    * min_weight: the smallest weight, computed on first access,
+      or None for an unweighted graph
+
+    The tables can be any indexable buffers, for example arrays from the
+    module array, numpy arrays or memoryviews. They are not copied.
+    graph[u] is the sequence of neighbors of u, so a CSRGraph can be used
+    wherever a listlist graph is only read. Algorithms that need the weights
+    accept the graph itself as weight, like for the listdict format, and
+    read them with items(u), since graph[u][v] is not a weight.
+    """
+    def __init__(self, offset, target, weight=None):
+        self.offset = offset
+        self.target = target
+        self.weight = weight
+        self._min_weight = None
+
+    @property
+    def min_weight(self):
+        """:returns: the smallest weight, or None for an unweighted graph
+        :complexity: O(m) on first access, then constant
+        """
+        if self._min_weight is None and self.weight is not None:
+            self._min_weight = min(self.weight, default=0)
+        return self._min_weight
+
+    def __len__(self):
+        return len(self.offset) - 1
+
+    def __getitem__(self, u):
+        return self.target[self.offset[u]:self.offset[u + 1]]
+
+    def nb_arcs(self):
+        """:returns: the number of arcs"""
+        return len(self.target)
+
+    def arcs(self, u):
+        """:returns: range of the indices of the arcs leaving u"""
+        return range(self.offset[u], self.offset[u + 1])
+
+    def items(self, u):
+        """:returns: iterator over the pairs (v, weight) of the arcs (u, v),
+        like graph[u].items() for a listdict graph
+        """
+        start, end = self.offset[u], self.offset[u + 1]
+        return zip(self.target[start:end], self.weight[start:end])
+# snip}
+
+
+def _weight_typecode(values):
+    """Type code for weights: 64 bit integers if possible, else doubles"""
+    if all(isinstance(w, int) for w in values):
+        return 'q'
+    return 'd'
+
+
+def arcs_to_csr(nb_nodes, tail, head, weight=None):
+    """Builds the csr representation of a graph given by its list of arcs
+
+    :param nb_nodes: number of vertices
+    :param tail: table of the origins of the arcs
+    :param head: table of the destinations of the arcs
+    :param weight: optional table of the weights of the arcs
+    :returns: graph in csr representation, the arcs leaving a vertex
+        appear in the same order as in the given tables
+    :complexity: linear
+    """
+    offset = array('q', [0]) * (nb_nodes + 1)
+    for u in tail:                      # count out-degrees
+        offset[u + 1] += 1
+    for u in range(nb_nodes):           # prefix sums
+        offset[u + 1] += offset[u]
+    free = offset[:-1]                  # next free slot for each vertex
+    target = array('i', [0]) * len(head)
+    values = None
+    if weight is not None:
+        values = array(_weight_typecode(weight), [0]) * len(head)
+    for a, u in enumerate(tail):        # stable counting sort
+        i = free[u]
+        free[u] += 1
+        target[i] = head[a]
+        if values is not None:
+            values[i] = weight[a]
+    return CSRGraph(offset, target, values)
+
+
+def listlist_and_matrix_to_csr(graph, weight=None):
+    """Transforms a graph of type listlist + optional weight matrix
+    into the csr representation
+
+    :param graph: in listlist representation
+    :param weight: optional weight matrix
+    :returns: graph in csr representation
+    :complexity: linear
+    """
+    offset = array('q', [0])
+    target = array('i')
+    for u, _ in enumerate(graph):
+        target.extend(graph[u])
+        offset.append(len(target))
+    if weight is None:
+        return CSRGraph(offset, target)
+    values = [weight[u][v] for u, _ in enumerate(graph) for v in graph[u]]
+    return CSRGraph(offset, target, array(_weight_typecode(values), values))
+
+
+def listdict_to_csr(sparse):
+    """Transforms a graph of type listdict into the csr representation
+
+    :param sparse: graph in listdict representation,
+        if some weight is None the csr graph is unweighted
+    :returns: graph in csr representation
+    :complexity: linear
+    """
+    offset = array('q', [0])
+    target = array('i')
+    values = []
+    for u, _ in enumerate(sparse):
+        target.extend(sparse[u])
+        values.extend(sparse[u].values())
+        offset.append(len(target))
+    if any(w is None for w in values):
+        return CSRGraph(offset, target)
+    return CSRGraph(offset, target, array(_weight_typecode(values), values))
+
+
+def matrix_to_csr(weight):
+    """Transforms a squared weight matrix into the csr representation
+    of the directed graph corresponding to the entries different from None
+
+    :param weight: squared weight matrix, weight[u][v] != None iff arc (u, v)
+        exists
+    :returns: graph in csr representation
+    :complexity: :math:`O(n^2)`
+    """
+    return listlist_and_matrix_to_csr(matrix_to_listlist(weight), weight)
+
+
+def reverse_csr(csr):
+    """Replaces all arcs (u, v) by arcs (v, u) in a graph in csr format
+
+    :param csr: graph in csr representation
+    :returns: reverse graph in csr representation, with the same weights
+    :complexity: linear
+    """
+    tail = array('i')
+    for u in range(len(csr)):
+        tail.extend([u] * (csr.offset[u + 1] - csr.offset[u]))
+    return arcs_to_csr(len(csr), csr.target, tail, csr.weight)
+
+
+def csr_to_listdict(csr):
+    """Transforms a graph of type csr into the listdict representation,
+    for algorithms that modify the graph, like the flow algorithms
+
+    :param csr: graph in csr representation
+    :returns: graph in listdict representation
+    :complexity: linear
+    """
+    weight = csr.weight
+    return [{csr.target[a]: (None if weight is None else weight[a])
+             for a in csr.arcs(u)} for u in range(len(csr))]
+
+# -----------------------------------------------------------------------------
+# binary file format for csr graphs, which can be memory mapped
+
+# The file starts with a header of 32 bytes: the magic string TRYALGOG,
+# the format version, the byte order ('<' or '>'), the type code of the
+# weights ('q', 'd' or '-' for unweighted), 2 padding bytes, n and m.
+# Then follow the tables offset (n + 1 int64), target (m int32),
+# padding to a multiple of 8 bytes, and weight (m int64 or double).
+
+
+_BINARY_MAGIC = b'TRYALGOG'
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct('=8sIcc2xQQ')
+
+
+def _binary_byteorder():
+    return b'<' if sys.byteorder == 'little' else b'>'
+
+
+def write_graph_binary(filename, graph):
+    """Writes a graph in csr format into a binary file,
+    which can be opened with open_graph_mmap
+
+    :param filename: the filename
+    :param graph: graph in csr representation
+    :complexity: linear
+    """
+    with open(filename, 'wb') as f:
+        _write_csr(f, graph)
+
+
+def _write_csr(f, graph):
+    """Writes the header and the tables of a graph in csr format at the
+    current position of the binary file f, which is a multiple of 8
+    """
+    offset = array('q', graph.offset)
+    target = array('i', graph.target)
+    if graph.weight is None:
+        weight = None
+        code = b'-'
+    else:
+        weight = array(_weight_typecode(graph.weight), graph.weight)
+        code = weight.typecode.encode()
+    f.write(_BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION,
+                                _binary_byteorder(), code,
+                                len(graph), len(target)))
+    offset.tofile(f)
+    target.tofile(f)
+    if weight is not None:
+        f.write(bytes(-f.tell() % 8))     # align the weights
+        weight.tofile(f)
+
+
+def open_graph_mmap(filename):
+    """Maps a binary graph file written by write_graph_binary read-only
+    into memory. The tables of the returned graph are memoryviews on the
+    mapped file, so several processes opening the same file share a single
+    copy in the page cache.
+
+    :param filename: the filename
+    :returns: graph in csr representation
+    :raises ValueError: if the file is not in the expected format
+    :complexity: constant, pages are read on demand
+    """
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _map_csr(memoryview(data), 0)[0]
+
+
+def _map_csr(view, start):
+    """Reads a graph written by _write_csr at position start of view,
+    without copying its tables
+
+    :returns: graph in csr representation with tables viewing into view,
+              position following the tables
+    :raises ValueError: if the data is not in the expected format
+    """
+    if len(view) < start + _BINARY_HEADER.size:
+        raise ValueError("not a binary graph file")
+    magic, version, byteorder, code, n, m = \
+        _BINARY_HEADER.unpack_from(view, start)
+    if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+        raise ValueError("not a binary graph file of version %d"
+                         % _BINARY_VERSION)
+    if byteorder != _binary_byteorder():
+        raise ValueError("binary graph file has wrong byte order")
+    start += _BINARY_HEADER.size
+    end = start + 8 * (n + 1) + 4 * m
+    if code != b'-':
+        end += -end % 8 + 8 * m
+    if len(view) < end:
+        raise ValueError("binary graph file is truncated")
+    offset = view[start:start + 8 * (n + 1)].cast('q')
+    start += 8 * (n + 1)
+    target = view[start:start + 4 * m].cast('i')
+    start += 4 * m
+    if code == b'-':
+        return CSRGraph(offset, target), end
+    start += -start % 8
+    weight = view[start:start + 8 * m].cast(code.decode())
+    return CSRGraph(offset, target, weight), end
+
 # -----------------------------------------------------------------------------
 # for shortest paths
 
@@ -392,4 +774,5 @@ class GraphNamedVertices:
             self.weight[u][v] = weight_uv
 # snip}
 
-Graph = Union[List[List[int]], List[Dict[int, Any]], GraphNamedVertices]
+Graph = Union[List[List[int]], List[Dict[int, Any]], GraphNamedVertices,
+              CSRGraph]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""\
+All pairs shortest paths by Johnson
+
+The graph is reweighted once with potentials h computed by Bellman-Ford,
+such that w(u, v) + h[u] - h[v] >= 0. Then a Dijkstra is run from every
+source, possibly in parallel on a pool of processes sharing the graph.
+
+christoph dürr - jill-jênn vie - 2026
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from tryalgo.bellman_ford import bellman_ford_queue
+from tryalgo.dijkstra import dijkstra
+from tryalgo.graph import CSRGraph, listlist_and_matrix_to_csr, listdict_to_csr
+
+
+# snip{
+def johnson(graph, weight, workers=None):
+    """All pairs shortest paths by Johnson
+
+    :param graph: directed graph in listlist, listdict or csr format
+    :param weight: can be negative.
+                   in matrix format or same listdict or csr graph
+    :param workers: number of processes running the Dijkstras,
+                    None or 1 to run them in the current process
+    :returns: generator of the pairs (source, dist), in the order of the
+              sources, where dist is the distance table from source.
+              Only a few rows are kept in memory at a time.
+    :raises ValueError: if the graph contains a negative circuit
+    :complexity: `O(|V||E| + |V|(|V| + |E|)log|V|)`
+    """
+    potential, _, cycle = bellman_ford_queue(graph, weight, None)
+    if cycle is not None:
+        raise ValueError("negative circuit %s" % cycle)
+    csr = _reweighted_csr(graph, weight, potential)
+    n = len(csr)
+    if workers is None or workers <= 1:
+        for source in range(n):
+            yield source, _distances(csr, potential, source)
+        return
+    tables = (csr.offset, csr.target, csr.weight)
+    blocks = []
+    try:
+        shared = []
+        for table in tables:
+            data = table.tobytes()
+            blocks.append(shared_memory.SharedMemory(create=True,
+                                                     size=max(1, len(data))))
+            blocks[-1].buf[:len(data)] = data
+            shared.append((blocks[-1].name, table.typecode, len(data)))
+        with ProcessPoolExecutor(workers, initializer=_attach_worker,
+                                 initargs=(shared, potential)) as pool:
+            pending = deque()
+            for source in range(n):
+                pending.append(pool.submit(_worker_distances, source))
+                if len(pending) >= 2 * workers:   # bound memory
+                    yield source + 1 - len(pending), \
+                        pending.popleft().result()
+            while pending:
+                yield n - len(pending), pending.popleft().result()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+# snip}
+
+
+def _reweighted_csr(graph, weight, potential):
+    """:returns: csr graph with weights w(u, v) + h[u] - h[v]"""
+    if isinstance(weight, CSRGraph):
+        csr = weight
+    elif graph and isinstance(graph[0], dict):
+        csr = listdict_to_csr(weight)
+    else:
+        csr = listlist_and_matrix_to_csr(graph, weight)
+    reweighted = array(csr.weight.typecode
+                       if isinstance(csr.weight, array) else 'd')
+    for u in range(len(csr)):
+        for arc in csr.arcs(u):
+            reweighted.append(csr.weight[arc] + potential[u]
+                              - potential[csr.target[arc]])
+    return CSRGraph(array('q', csr.offset), array('i', csr.target),
+                    reweighted)
+
+
+def _distances(csr, potential, source):
+    """Distance table from source in the original weights"""
+    dist, _ = dijkstra(csr, csr, source)
+    h_source = potential[source]
+    return [d - h_source + h_v if d != float('inf') else d
+            for d, h_v in zip(dist, potential)]
+
+
+_WORKER = None      # graph, potential and shared blocks in a worker process
+
+
+def _attach_worker(shared, potential):
+    """Maps the csr tables from the shared memory blocks"""
+    global _WORKER                  # pylint: disable=global-statement
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in shared]
+    tables = [block.buf[:nbytes].cast(code)
+              for block, (_, code, nbytes) in zip(blocks, shared)]
+    _WORKER = (CSRGraph(*tables), potential, blocks)
+
+
+def _worker_distances(source):
+    csr, potential, _ = _WORKER
+    return _distances(csr, potential, source)
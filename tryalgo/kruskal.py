@@ -6,27 +6,39 @@ Minimum spanning tree by kruskal
 jill-jenn vie et christoph durr - 2014-2018
 """
 
+from array import array
 from math import sqrt
 import random
+from tryalgo.graph import CSRGraph
+
+try:
+    import numpy as np
+except ImportError:     # numpy is optional, used by UnionFind.find_many
+    np = None  # type: ignore
 
 
 # snip{ union-find
 class UnionFind:
     """Maintains a partition of {0, ..., n-1}
+
+    Union by size and path halving, with parents and sizes stored in
+    flat arrays.
     """
     def __init__(self, n):
-        self.up_bound = list(range(n))
-        self.rank = [0] * n
+        self.up_bound = array('i', range(n))
+        self.part_size = array('i', [1]) * n   # valid for representatives
+        self.nb_components = n
 
     def find(self, x_index):
         """
         :returns: identifier of part containing x_index
-        :complex_indexity: O(inverse_ackerman(n))
+        :complexity: O(inverse_ackerman(n))
         """
-        if self.up_bound[x_index] == x_index:
-            return x_index
-        self.up_bound[x_index] = self.find(self.up_bound[x_index])
-        return self.up_bound[x_index]
+        up_bound = self.up_bound
+        while up_bound[x_index] != x_index:
+            up_bound[x_index] = up_bound[up_bound[x_index]]   # halving
+            x_index = up_bound[x_index]
+        return x_index
 
     def union(self, x_index, y_index):
         """
@@ -38,14 +50,72 @@ class UnionFind:
         repr_y = self.find(y_index)
         if repr_x == repr_y:       # already in the same component
             return False
-        if self.rank[repr_x] == self.rank[repr_y]:
-            self.rank[repr_x] += 1
-            self.up_bound[repr_y] = repr_x
-        elif self.rank[repr_x] > self.rank[repr_y]:
-            self.up_bound[repr_y] = repr_x
-        else:
-            self.up_bound[repr_x] = repr_y
+        if self.part_size[repr_x] < self.part_size[repr_y]:
+            repr_x, repr_y = repr_y, repr_x
+        self.up_bound[repr_y] = repr_x
+        self.part_size[repr_x] += self.part_size[repr_y]
+        self.nb_components -= 1
         return True
+
+    def size(self, x_index):
+        """:returns: number of elements in the part containing x_index"""
+        return self.part_size[self.find(x_index)]
+
+    def find_many(self, indices):
+        """:param indices: iterable of elements, or numpy array of indices
+        :returns: list of their identifiers, or numpy array of identifiers
+            computed by vectorized pointer jumping if indices is an array
+        :complexity: O(len(indices) log n)
+        """
+        if np is not None and isinstance(indices, np.ndarray):
+            up_bound = np.frombuffer(self.up_bound, dtype=np.intc)
+            roots = up_bound[indices]
+            while True:     # depth is logarithmic by union by size
+                above = up_bound[roots]
+                if (above == roots).all():
+                    return roots
+                roots = above
+        return [self.find(x_index) for x_index in indices]
+
+    def union_many(self, x_indices, y_indices):
+        """Merges the parts of x_indices[i] and y_indices[i] for every i,
+        in order
+
+        :param x_indices, y_indices: iterables or numpy arrays of indices
+        :returns: list of booleans, True if the i-th union merged two parts
+        """
+        if np is not None:
+            if isinstance(x_indices, np.ndarray):
+                x_indices = x_indices.tolist()
+            if isinstance(y_indices, np.ndarray):
+                y_indices = y_indices.tolist()
+        up_bound = self.up_bound
+        part_size = self.part_size
+        merged = []
+        for x, y in zip(x_indices, y_indices):   # union inlined
+            while up_bound[x] != x:
+                up_bound[x] = x = up_bound[up_bound[x]]
+            while up_bound[y] != y:
+                up_bound[y] = y = up_bound[up_bound[y]]
+            if x == y:
+                merged.append(False)
+                continue
+            if part_size[x] < part_size[y]:
+                x, y = y, x
+            up_bound[y] = x
+            part_size[x] += part_size[y]
+            merged.append(True)
+        self.nb_components -= merged.count(True)
+        return merged
+
+    def labels(self):
+        """:returns: snapshot table giving for every element the number of
+            its part, parts are numbered from 0 in order of their
+            smallest element
+        """
+        label = {}
+        return [label.setdefault(self.find(x), len(label))
+                for x in range(len(self.up_bound))]
 # snip}
 
 
@@ -54,21 +124,28 @@ class UnionFind:
 def kruskal(graph, weight):
     """Minimum spanning tree by Kruskal
 
-    :param graph: undirected graph in listlist or listdict format
-    :param weight: in matrix format or same listdict graph
+    :param graph: undirected graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
     :returns: list of edges of the tree
     :complexity: ``O(|E|log|E|)``
     """
     u_f = UnionFind(len(graph))
     edges = []
-    for u, _ in enumerate(graph):
-        for v in graph[u]:
-            edges.append((weight[u][v], u, v))
+    if isinstance(weight, CSRGraph):
+        for u in range(len(weight)):
+            for arc in weight.arcs(u):
+                edges.append((weight.weight[arc], u, weight.target[arc]))
+    else:
+        for u, _ in enumerate(graph):
+            for v in graph[u]:
+                edges.append((weight[u][v], u, v))
     edges.sort()
     min_span_tree = []
     for w_idx, u_idx, v_idx in edges:
         if u_f.union(u_idx, v_idx):
             min_span_tree.append((u_idx, v_idx))
+            if u_f.nb_components == 1:
+                break
     return min_span_tree
 # snip}
 
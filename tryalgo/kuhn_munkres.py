@@ -38,6 +38,11 @@ primal-dual algorithm:
 
 """
 
+try:
+    import numpy as np
+except ImportError:     # numpy is optional, used by kuhn_munkres_vectorized
+    np = None  # type: ignore
+
 
 # snip{
 # pylint: disable=too-many-locals, too-many-branches
@@ -105,3 +110,141 @@ def kuhn_munkres(G, TOLERANCE=1e-6):
             v = prec
     return (mu, sum(lu) + sum(lv))
 # snip}
+
+
+# snip{ kuhn_munkres_vectorized
+def kuhn_munkres_vectorized(G):
+    """Maximum profit bipartite matching by shortest augmenting paths,
+    in the style of Jonker-Volgenant.
+
+    The vertices of the smaller side are inserted one by one, each time
+    growing a Dijkstra-like tree on the reduced costs until a free vertex
+    is reached. If numpy is installed, the scans over the vertices of the
+    larger side are done on whole float64 rows at once.
+
+    :param G: weight matrix where G[u][v] is the weight of edge (u,v),
+              list of lists or numpy array, float('-inf') for forbidden
+              edges
+    :comment: U and V can have different cardinalities
+    :returns: matching table from U to V, with None for unmatched vertices
+              if len(U) > len(V), value of matching
+    :raises ValueError: if the forbidden edges prevent the vertices of the
+                        smaller side from being all matched
+    :complexity: :math:`O(n^2 m)` for n = min(|U|, |V|), m = max(|U|, |V|)
+    """
+    nU = len(G)
+    nV = len(G[0]) if nU else 0
+    transposed = nU > nV
+    if np is not None:
+        cost = -np.asarray(G, dtype=np.float64).reshape(nU, nV)
+        if transposed:
+            cost = cost.T
+        row = _assign_array(np.ascontiguousarray(cost)).tolist()
+    else:
+        if transposed:
+            cost = [[-G[u][v] for u in range(nU)] for v in range(nV)]
+        else:
+            cost = [[-x for x in G[u]] for u in range(nU)]
+        row = _assign_lists(cost, nU if transposed else nV)
+    if transposed:              # row[u] is the vertex matched to u
+        mu = [None if v < 0 else v for v in row]
+    else:                       # row[v] is the vertex matched to v
+        mu = [None] * nU
+        for v, u in enumerate(row):
+            if u >= 0:
+                mu[u] = v
+    return mu, sum(G[u][mu[u]] for u in range(nU) if mu[u] is not None)
+
+
+def _assign_lists(cost, m):
+    """Minimum cost assignment of the n rows of cost to distinct columns,
+    for n at most the number of columns m
+
+    :returns: table giving for each column its row or -1
+    """
+    n = len(cost)
+    u = [0] * n                 # potentials
+    v = [0] * m
+    row = [-1] * m
+    for i in range(n):
+        minv = [float('inf')] * m   # reduced distance to column
+        way = [-1] * m              # previous column in the tree, -1 = i
+        used = [False] * m          # column in the tree
+        tree_rows = [i]
+        tree_cols = []
+        i0, j0 = i, -1
+        while True:
+            ci, ui = cost[i0], u[i0]
+            delta, j1 = float('inf'), -1
+            for j in range(m):
+                if not used[j]:
+                    cur = ci[j] - ui - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            if delta == float('inf'):
+                raise ValueError("no complete matching of row %i" % i)
+            for r in tree_rows:
+                u[r] += delta
+            for j in tree_cols:
+                v[j] -= delta
+            for j in range(m):
+                if not used[j]:
+                    minv[j] -= delta
+            used[j1] = True
+            tree_cols.append(j1)
+            j0 = j1
+            if row[j0] < 0:
+                break
+            i0 = row[j0]
+            tree_rows.append(i0)
+        _augment_assignment(row, way, i, j0)
+    return row
+
+
+def _assign_array(cost):
+    """Same as _assign_lists on a numpy array, with vectorized scans"""
+    n, m = cost.shape
+    u = np.zeros(n)
+    v = np.zeros(m)
+    row = np.full(m, -1)
+    for i in range(n):
+        minv = np.full(m, np.inf)
+        way = np.full(m, -1)
+        used = np.zeros(m, dtype=bool)
+        tree_rows = [i]
+        tree_cols = []
+        i0, j0 = i, -1
+        while True:
+            cur = cost[i0] - u[i0] - v
+            better = ~used & (cur < minv)
+            minv[better] = cur[better]
+            way[better] = j0
+            j1 = int(np.argmin(np.where(used, np.inf, minv)))
+            delta = minv[j1]
+            if used[j1] or delta == np.inf:
+                raise ValueError("no complete matching of row %i" % i)
+            u[tree_rows] += delta
+            v[tree_cols] -= delta
+            minv[~used] -= delta
+            used[j1] = True
+            tree_cols.append(j1)
+            j0 = j1
+            if row[j0] < 0:
+                break
+            i0 = int(row[j0])
+            tree_rows.append(i0)
+        _augment_assignment(row, way, i, j0)
+    return row
+
+
+def _augment_assignment(row, way, i, j):
+    """Shifts the rows along the alternating path from row i to the
+    free column j"""
+    while j >= 0:
+        prev = way[j]
+        row[j] = row[prev] if prev >= 0 else i
+        j = prev
+# snip}
@@ -7,7 +7,7 @@ jill-jenn vie et christoph durr - 2014-2018
 """
 # http://leetcode.com/2011/11/longest-palindromic-substring-part-ii.html
 
-from tryalgo.range_minimum_query import RangeMinQuery
+from tryalgo.range_minimum_query import SparseTable
 
 
 def log2floor(n):
@@ -104,11 +104,11 @@ class LowestCommonAncestorRMQ:
                 neighbor = graph[node][succ[node]]
                 succ[node] += 1
                 to_visit.append((level + 1, neighbor, node))
-        self.rmq = RangeMinQuery(dfs_trace, (float('inf'), None))
+        self.rmq = SparseTable(dfs_trace, (float('inf'), None))
 
     def query(self, u, v):
         """:returns: the lowest common ancestor of u and v
-        :complexity: O(log n)
+        :complexity: O(1)
         """
         lu = self.last[u]
         lv = self.last[v]
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""\
+Minimum cost flow by successive shortest paths
+
+Flow is sent along shortest paths in the residual network, found by
+Dijkstra on the reduced costs cost(u, v) + h[u] - h[v], which are kept
+non-negative by the potentials h (Johnson). With capacity scaling, only
+arcs of residual capacity at least delta are used, for decreasing
+powers of two delta.
+
+christoph dürr - jill-jênn vie - 2026
+"""
+
+from heapq import heappop, heappush
+from tryalgo.dinic import dinic_iterative
+from tryalgo.graph import ResidualNetwork
+
+
+# snip{
+# pylint: disable=too-many-arguments, too-many-locals, too-many-branches
+def min_cost_flow(graph, capacity, cost, source, target, demand=None,
+                  scaling=False):
+    """Minimum cost flow by successive shortest paths
+
+    :param graph: directed graph in listlist or listdict format
+    :param capacity: in matrix format or same listdict graph
+    :param cost: in matrix format or same listdict graph,
+                 can be negative
+    :param int source: vertex
+    :param int target: vertex
+    :param demand: flow value to send from source to target,
+                   None for a maximum flow
+    :param bool scaling: use capacity scaling, for large integer
+                         capacities
+    :assumes: capacities are finite, and integers if scaling is used
+    :returns: skew symmetric flow in listdict format, flow value, cost
+              of the flow. The flow value can be less than the demand,
+              if the demand exceeds the maximum flow value.
+    :complexity: :math:`O(F |E| \\log |V|)` for a flow value F,
+                 or :math:`O(|E|^2 \\log |V| \\log U)` with scaling,
+                 for a maximum capacity U, after a maximum flow
+                 computation by dinic_iterative
+    """
+    assert source != target
+    net = ResidualNetwork(graph, capacity, cost)
+    head, residual, arc_cost = net.head, net.residual, net.cost
+    n = len(net)
+    potential = _initial_potential(net)
+    excess = [0] * n
+    value = dinic_iterative(graph, capacity, source, target)[1]
+    if demand is not None:
+        value = min(value, demand)
+    excess[source] = value          # supply
+    excess[target] = -value         # and demand are feasible
+    if scaling:
+        delta = 1
+        while 2 * delta <= max(net.capac, default=0):
+            delta *= 2
+    else:
+        delta = 0                   # any positive residual capacity
+    while True:
+        for a, v in enumerate(head):     # saturate arcs of negative
+            u = head[a ^ 1]                 # reduced cost
+            if residual[a] > 0 and residual[a] >= delta and \
+                    arc_cost[a] + potential[u] - potential[v] < 0:
+                excess[u] -= residual[a]
+                excess[v] += residual[a]
+                residual[a ^ 1] += residual[a]
+                residual[a] = 0
+        progress = True
+        while progress:
+            progress = False
+            for u in range(n):
+                while excess[u] > 0 and excess[u] >= delta:
+                    path = _shortest_path(net, potential, excess, u, delta)
+                    if path is None:
+                        break
+                    v = head[path[-1]]
+                    amount = min([excess[u], -excess[v]] +
+                                 [residual[a] for a in path])
+                    for a in path:
+                        residual[a] -= amount
+                        residual[a ^ 1] += amount
+                    excess[u] -= amount
+                    excess[v] += amount
+                    progress = True
+        if delta <= 1:
+            break
+        delta //= 2
+    total = sum(arc_cost[a] * (net.capac[a] - residual[a])
+                for a in range(0, len(head), 2))
+    return net.flow(), value, total
+
+
+def _initial_potential(net):
+    """Bellman-Ford from a virtual source with arcs of cost 0 to all
+    vertices, in the residual network
+
+    :returns: potentials making all reduced costs non-negative,
+              or zeros if there is a negative circuit, whose arcs will
+              be saturated instead
+    """
+    head, residual, cost = net.head, net.residual, net.cost
+    n = len(net)
+    dist = [0] * n
+    for _ in range(n):
+        changed = False
+        for a, v in enumerate(head):
+            if residual[a] > 0 and dist[head[a ^ 1]] + cost[a] < dist[v]:
+                dist[v] = dist[head[a ^ 1]] + cost[a]
+                changed = True
+        if not changed:
+            return dist
+    return [0] * n
+
+
+def _shortest_path(net, potential, excess, source, delta):
+    """Dijkstra on reduced costs from source to the closest vertex with
+    deficit, using only arcs of residual capacity at least delta.
+    Updates the potentials so that reduced costs remain non-negative.
+
+    :returns: list of arcs of the path, or None if no vertex with deficit
+              is reachable
+    """
+    head, residual, offset, arcs = net.head, net.residual, net.offset, \
+        net.arcs
+    n = len(net)
+    dist = [float('inf')] * n
+    prec = [None] * n               # arc to vertex in shortest path tree
+    black = [False] * n
+    dist[source] = 0
+    heap = [(0, source)]
+    found = None
+    while heap:
+        dist_node, node = heappop(heap)
+        if black[node]:
+            continue
+        black[node] = True
+        if excess[node] < 0 and -excess[node] >= delta:
+            found = node
+            break
+        for i in range(offset[node], offset[node + 1]):
+            a = arcs[i]
+            if residual[a] > 0 and residual[a] >= delta:
+                neighbor = head[a]
+                alt = dist_node + net.cost[a] + potential[node] \
+                    - potential[neighbor]
+                if alt < dist[neighbor]:
+                    dist[neighbor] = alt
+                    prec[neighbor] = a
+                    heappush(heap, (alt, neighbor))
+    if found is None:
+        return None
+    bound = dist[found]
+    for v in range(n):
+        potential[v] += min(dist[v], bound)
+    path = []
+    node = found
+    while node != source:
+        path.append(prec[node])
+        node = head[prec[node] ^ 1]
+    path.reverse()
+    return path
+# snip}
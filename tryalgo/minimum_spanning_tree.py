@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""\
+Minimum spanning trees by Prim and Boruvka
+
+Prim without heap scans all remaining vertices at every step, which is
+optimal for dense graphs. Boruvka merges every component along its
+cheapest outgoing edge in each round. The scans of a round are
+independent, and can be distributed over a pool of processes.
+
+christoph dürr - jill-jênn vie - 2026
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from math import log2
+from multiprocessing import RawArray
+from tryalgo.graph import CSRGraph, listlist_and_matrix_to_csr, listdict_to_csr
+from tryalgo.kruskal import UnionFind
+
+
+# snip{
+def prim(graph, weight):
+    """Minimum spanning tree by Prim, without heap
+
+    :param graph: undirected graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
+    :returns: list of edges of the tree, or of a minimum spanning forest
+              if the graph is not connected
+    :complexity: :math:`O(|V|^2 + |E|)`
+    """
+    if isinstance(weight, CSRGraph):
+        items = weight.items
+    else:
+        def items(u):
+            return ((v, weight[u][v]) for v in graph[u])
+    n = len(graph)
+    best = [float('inf')] * n       # lightest edge to the tree
+    parent = [None] * n
+    remaining = list(range(n))      # vertices not in the tree
+    tree = []
+    while remaining:
+        u = min(remaining, key=best.__getitem__)
+        remaining[remaining.index(u)] = remaining[-1]
+        remaining.pop()
+        best[u] = float('-inf')         # u is in the tree
+        if parent[u] is not None:
+            tree.append((parent[u], u))
+        for v, w in items(u):
+            if w < best[v]:
+                best[v] = w
+                parent[v] = u
+    return tree
+# snip}
+
+
+# snip{ boruvka
+def boruvka(graph, weight, workers=None):
+    """Minimum spanning tree by Boruvka
+
+    :param graph: undirected graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
+    :param workers: number of processes scanning for the cheapest edges,
+                    None or 1 to scan them in the current process
+    :returns: list of edges of the tree, or of a minimum spanning forest
+              if the graph is not connected
+    :complexity: :math:`O(|E| \\log |V|)`
+    """
+    if isinstance(weight, CSRGraph):
+        csr = weight
+    elif graph and isinstance(graph[0], dict):
+        csr = listdict_to_csr(weight)
+    else:
+        csr = listlist_and_matrix_to_csr(graph, weight)
+    n = len(csr)
+    if n == 0:
+        return []
+    u_f = UnionFind(n)
+    tree = []
+    pool = None
+    if workers is not None and workers > 1:
+        shared_label = RawArray('i', n)     # labels of the current round
+        pool = ProcessPoolExecutor(workers, initializer=_attach_worker,
+                                   initargs=(csr.offset, csr.target,
+                                             csr.weight, shared_label))
+        step = -(-n // workers)
+        chunks = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+    try:
+        while u_f.nb_components > 1:
+            label = u_f.find_many(range(n))
+            if pool is None:
+                cheapest = _cheapest_edges(csr, label, 0, n)
+            else:
+                shared_label[:] = label     # sent once for all chunks
+                cheapest = {}
+                for part in pool.map(_worker_cheapest_edges, chunks):
+                    for comp, edge in part.items():
+                        if comp not in cheapest or edge < cheapest[comp]:
+                            cheapest[comp] = edge
+            if not cheapest:            # spanning forest is complete
+                break
+            for _, u, v in cheapest.values():
+                if u_f.union(u, v):
+                    tree.append((u, v))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return tree
+
+
+def _cheapest_edges(csr, label, lo, hi):
+    """:returns: dictionary mapping every component with an edge leaving
+    from a vertex in [lo, hi) to its cheapest leaving edge (w, u, v)
+    """
+    cheapest = {}
+    offset = csr.offset
+    target = csr.target
+    weight = csr.weight
+    inf = float('inf')
+    for u in range(lo, hi):
+        comp = label[u]
+        best, best_arc = inf, -1
+        for arc in range(offset[u], offset[u + 1]):
+            if weight[arc] < best and label[target[arc]] != comp:
+                best, best_arc = weight[arc], arc
+        if best_arc >= 0 and best < cheapest.get(comp, (inf,))[0]:
+            cheapest[comp] = (best, u, target[best_arc])
+    return cheapest
+
+
+_WORKER = None          # csr graph and shared labels in a worker process
+
+
+def _attach_worker(offset, target, weight, shared_label):
+    global _WORKER                  # pylint: disable=global-statement
+    _WORKER = (CSRGraph(offset, target, weight),
+               memoryview(shared_label).cast('B').cast('i'))
+
+
+def _worker_cheapest_edges(chunk):
+    csr, label = _WORKER
+    lo, hi = chunk
+    return _cheapest_edges(csr, label, lo, hi)
+# snip}
+
+
+def minimum_spanning_tree(graph, weight, workers=None):
+    """Minimum spanning tree, by prim for dense graphs,
+    and by boruvka otherwise
+
+    :param graph: undirected graph in listlist, listdict or csr format
+    :param weight: in matrix format or same listdict or csr graph
+    :param workers: number of processes used by boruvka
+    :returns: list of edges of the tree, or of a minimum spanning forest
+              if the graph is not connected
+    :complexity: :math:`O(\\min(|V|^2, |E| \\log |V|))`
+    """
+    n = len(graph)
+    if isinstance(weight, CSRGraph):
+        nb_arcs = weight.nb_arcs()
+    else:
+        nb_arcs = sum(len(graph[u]) for u in range(n))
+    if nb_arcs * log2(max(n, 2)) >= n * n:
+        return prim(graph, weight)
+    return boruvka(graph, weight, workers)
@@ -93,3 +93,115 @@ class OurHeap:
         else:
             self.up(i)
 # snip}
+
+
+# snip{ indexed_heap
+class IndexedHeap:
+    """ min heap over the items 0 to n-1, with a d-ary tree
+
+    * heap: the actual heap, heap[0] = item of smallest key
+    * pos: pos[x] is the index of item x in heap, or -1 if x is absent
+    * key: key[x] is the priority of item x
+    * arity: number of children of each node in the tree
+
+    All tables are flat lists indexed by the items, so no hashing is done.
+
+    :complexity: init O(n), len and contains O(1), push, pop and update
+                 O(arity log n / log arity)
+    """
+    def __init__(self, n, keys=None, arity=4):
+        """:param n: number of possible items
+        :param keys: if given, all items are inserted with key keys[x],
+                     and the heap is built bottom-up in linear time
+        :param arity: number of children of each node, at least 2
+        """
+        assert arity >= 2
+        self.arity = arity
+        if keys is None:
+            self.key = [None] * n
+            self.heap = []
+            self.pos = [-1] * n
+        else:
+            self.key = list(keys)
+            self.heap = list(range(n))
+            self.pos = list(range(n))
+            for i in reversed(range((n + arity - 2) // arity)):
+                self.down(i)           # heapify from the last inner node
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, x):
+        return self.pos[x] >= 0
+
+    def push(self, x, key):
+        """Insert item x with the given key.
+           Assumption: x is not already in the heap"""
+        assert self.pos[x] < 0
+        self.key[x] = key
+        self.pos[x] = len(self.heap)
+        self.heap.append(x)        # add a new leaf
+        self.up(self.pos[x])
+
+    def pop(self):
+        """Remove and return the pair (key, item) of smallest key"""
+        root = self.heap[0]
+        self.pos[root] = -1
+        x = self.heap.pop()        # remove last leaf
+        if self.heap:
+            self.heap[0] = x       # move the last leaf
+            self.pos[x] = 0        # to the root
+            self.down(0)
+        return self.key[root], root
+
+    def update(self, x, key):
+        """Change the key of item x, inserting it if necessary"""
+        if self.pos[x] < 0:
+            self.push(x, key)
+        elif key < self.key[x]:    # decrease key
+            self.key[x] = key
+            self.up(self.pos[x])
+        else:
+            self.key[x] = key
+            self.down(self.pos[x])
+# snip}
+
+    def up(self, i):
+        """The key of heap[i] has decreased. Maintain heap invariant."""
+        heap, pos, key, arity = self.heap, self.pos, self.key, self.arity
+        x = heap[i]
+        kx = key[x]
+        while i > 0:
+            parent = (i - 1) // arity
+            y = heap[parent]
+            if key[y] <= kx:
+                break
+            heap[i] = y            # move parent down
+            pos[y] = i
+            i = parent
+        heap[i] = x                # insertion index found
+        pos[x] = i
+
+    def down(self, i):
+        """The key of heap[i] has increased. Maintain heap invariant."""
+        heap, pos, key, arity = self.heap, self.pos, self.key, self.arity
+        n = len(heap)
+        x = heap[i]
+        kx = key[x]
+        while True:
+            first = arity * i + 1
+            if first >= n:
+                break
+            best = first           # find the smallest child
+            kbest = key[heap[first]]
+            for child in range(first + 1, min(first + arity, n)):
+                kchild = key[heap[child]]
+                if kchild < kbest:
+                    best, kbest = child, kchild
+            if kx <= kbest:
+                break
+            heap[i] = heap[best]   # move smallest child up
+            pos[heap[i]] = i
+            i = best
+        heap[i] = x                # insertion index found
+        pos[x] = i
@@ -10,6 +10,10 @@ jill-jenn vie et christoph durr - 2014-2019
 # pylint: disable=too-many-arguments
 
 from __future__ import print_function
+try:
+    import numpy as np
+except ImportError:     # numpy is optional, used by range_min_many
+    np = None  # type: ignore
 
 
 # snip{
@@ -69,6 +73,129 @@ class RangeMinQuery:
 # snip}
 
 
+# snip{ sparse-table
+class SparseTable:
+    """Range minimum query on a static table
+
+    stores for every level j the minima of all ranges of size 2^j,
+    all levels concatenated in a single flat list.
+    A query is the minimum of two overlapping ranges of the same level.
+    :complexity: construction in O(n log n), queries in O(1),
+                 for n = len(t)
+    """
+    def __init__(self, t, INF=float('inf')):
+        self.INF = INF
+        n = len(t)
+        self.log = [0] * (n + 1)        # log[k] = floor(log2(k))
+        for k in range(2, n + 1):
+            self.log[k] = self.log[k // 2] + 1
+        self.offset = [0]               # level j starts at offset[j]
+        self.s = list(t)
+        span = 1
+        while 2 * span <= n:
+            prev = self.offset[-1]
+            self.offset.append(len(self.s))
+            self.s.extend(min(self.s[prev + i], self.s[prev + i + span])
+                          for i in range(n - 2 * span + 1))
+            span *= 2
+        self._array = None              # numpy copy of s, False if the
+        #                                 values are not all numbers
+        self._log_array = None          # numpy copies of log and offset
+        self._offset_array = None
+
+    def __getitem__(self, i):
+        return self.s[i]
+
+    def range_min(self, i, k):
+        """:returns:  min{ t[i], t[i + 1], ..., t[k - 1]}
+        :complexity: O(1)
+        """
+        if i >= k:
+            return self.INF
+        j = self.log[k - i]
+        start = self.offset[j]
+        return min(self.s[start + i], self.s[start + k - (1 << j)])
+
+    def range_min_many(self, starts, ends):
+        """:returns: the list of range_min(i, k) for i, k in zip(starts, ends),
+                     a numpy array if numpy is available, the table is
+                     not empty and its values and INF are numbers
+        :complexity: O(len(starts)), vectorized with numpy
+        """
+        if self._array is None:
+            numeric = np is not None and self.s and \
+                isinstance(self.INF, (int, float)) and \
+                all(isinstance(x, (int, float)) for x in self.s)
+            self._array = np.asarray(self.s) if numeric else False
+            if numeric:
+                self._log_array = np.asarray(self.log, dtype=np.int64)
+                self._offset_array = np.asarray(self.offset, dtype=np.int64)
+        if self._array is False:
+            return [self.range_min(i, k) for i, k in zip(starts, ends)]
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        empty = ends <= starts
+        starts = np.where(empty, 0, starts)     # empty ranges read t[0]
+        length = np.where(empty, 1, ends - starts)
+        level = self._log_array[length]
+        start = self._offset_array[level]
+        result = np.minimum(self._array[start + starts],
+                            self._array[start + starts + length
+                                        - (1 << level)])
+        if empty.any():
+            result = np.where(empty, self.INF, result)
+        return result
+
+
+class BlockSparseTable:
+    """Range minimum query on a static table with linear memory
+
+    the table is cut into blocks of size about log n. Every block stores
+    the prefix and suffix minima of its items, and a sparse table holds
+    the block minima. A query within a single block scans it.
+    :complexity: construction in O(n), queries in O(1) if they span
+                 several blocks, and O(log n) otherwise
+    """
+    def __init__(self, t, INF=float('inf')):
+        self.INF = INF
+        self.t = list(t)
+        n = len(t)
+        self.block = max(1, n.bit_length())
+        self.prefix = list(t)           # minima from block start
+        self.suffix = list(t)           # minima until block end
+        b = self.block
+        for i in range(n):
+            if i % b:
+                self.prefix[i] = min(self.prefix[i - 1], self.prefix[i])
+        for i in range(n - 2, -1, -1):
+            if (i + 1) % b:
+                self.suffix[i] = min(self.suffix[i], self.suffix[i + 1])
+        self.blocks = SparseTable([self.suffix[lo]
+                                   for lo in range(0, n, b)], INF)
+
+    def __getitem__(self, i):
+        return self.t[i]
+
+    def range_min(self, i, k):
+        """:returns:  min{ t[i], t[i + 1], ..., t[k - 1]}
+        :complexity: O(1), or O(log n) if i and k - 1 are in the same block
+        """
+        if i >= k:
+            return self.INF
+        first = i // self.block
+        last = (k - 1) // self.block
+        if first == last:
+            return min(self.t[i:k])
+        inner = self.blocks.range_min(first + 1, last)
+        return min(self.suffix[i], self.prefix[k - 1], inner)
+
+    def range_min_many(self, starts, ends):
+        """:returns: the list of range_min(i, k) for i, k in zip(starts, ends)
+        """
+        return [self.range_min(i, k) for i, k in zip(starts, ends)]
+# snip}
+
+
 # pylint: disable=missing-docstring, no-else-return,
 # pylint: disable=anomalous-backslash-in-string
 class LazySegmentTree:
@@ -250,6 +377,164 @@ class LazySegmentTree:
         f.close()
 
 
+# snip{ segment-tree
+# pylint: disable=too-many-instance-attributes
+class SegmentTree:
+    """maintains a table t, and answers queries combine(t[i], ..., t[k - 1])
+    for an associative function combine with neutral element identity.
+    Optionally, updates apply an action to all items of an index range.
+
+    The tree is stored bottom-up in a flat list s, with the leaves at
+    positions N, ..., 2N - 1 and node p combining the nodes 2p and 2p + 1.
+    Pending actions of the inner nodes are stored in a flat list lazy.
+    No recursion is used. The given ranges are in the form [i, k) where
+    i is included and k excluded.
+
+    For example range additions and sum queries are obtained with
+    SegmentTree(t, operator.add, 0, lambda f, x, size: x + f * size,
+    operator.add, 0).
+    """
+    # pylint: disable=too-many-arguments
+    def __init__(self, t, combine, identity, action=None, compose=None,
+                 no_action=None):
+        """
+        :param t: table of values
+        :param combine: associative function on two values
+        :param identity: neutral element for combine
+        :param action: optional function (f, x, size) returning the
+                       combination of size items, whose combination was x,
+                       after applying f to each of them
+        :param compose: function (f, g) returning the action of
+                        applying g and then f
+        :param no_action: the action leaving all items unchanged
+        :complexity: O(n), for n = len(t)
+        """
+        self.combine = combine
+        self.identity = identity
+        self.action = action
+        self.compose = compose
+        self.no_action = no_action
+        self.log = 0
+        while (1 << self.log) < len(t):        # find size N
+            self.log += 1
+        self.N = 1 << self.log
+        self.s = [identity] * (2 * self.N)
+        self.s[self.N:self.N + len(t)] = t
+        for p in range(self.N - 1, 0, -1):
+            self.s[p] = combine(self.s[2 * p], self.s[2 * p + 1])
+        if action is not None:
+            self.lazy = [no_action] * self.N
+
+    def _apply(self, p, f):
+        """applies action f to node p"""
+        size = self.N >> (p.bit_length() - 1)
+        self.s[p] = self.action(f, self.s[p], size)
+        if p < self.N:
+            self.lazy[p] = self.compose(f, self.lazy[p])
+
+    def _push(self, p):
+        """propagates the pending action of node p to its children"""
+        f = self.lazy[p]
+        if f != self.no_action:
+            self._apply(2 * p, f)
+            self._apply(2 * p + 1, f)
+            self.lazy[p] = self.no_action
+
+    def _push_boundaries(self, left, right):
+        """propagates the pending actions down to the leaves left and
+        right - 1, from the root, skipping nodes inside [left, right)"""
+        for h in range(self.log, 0, -1):
+            if (left >> h) << h != left:
+                self._push(left >> h)
+            if (right >> h) << h != right:
+                self._push((right - 1) >> h)
+
+    def __getitem__(self, i):
+        return self.query(i, i + 1)
+
+    def __setitem__(self, i, v):
+        """sets t[i] to v.
+
+        :complexity: O(log len(t))
+        """
+        self.set_many([i], [v])
+
+    def set_many(self, indices, values):
+        """sets t[i] to v for all i, v in zip(indices, values),
+        every ancestor of the modified leaves being recomputed once
+
+        :complexity: O(min(k log n, k + n)) for k = len(indices) without
+                     actions, O(k log n) otherwise
+        """
+        combine, s = self.combine, self.s
+        nodes = set()
+        for i, v in zip(indices, values):
+            p = self.N + i
+            if self.action is not None:
+                for h in range(self.log, 0, -1):
+                    self._push(p >> h)
+            s[p] = v
+            nodes.add(p // 2)
+        for _ in range(self.log):               # climb up level by level
+            for p in nodes:
+                s[p] = combine(s[2 * p], s[2 * p + 1])
+            nodes = {p // 2 for p in nodes}
+
+    def query(self, i, k):
+        """:returns: combine(t[i], t[i + 1], ..., t[k - 1]),
+                     or identity if i >= k
+        :complexity: O(log len(t))
+        """
+        if i >= k:
+            return self.identity
+        left = i + self.N
+        right = k + self.N
+        if self.action is not None:
+            self._push_boundaries(left, right)
+        combine, s = self.combine, self.s
+        left_val = right_val = self.identity
+        while left < right:
+            if left & 1:
+                left_val = combine(left_val, s[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                right_val = combine(s[right], right_val)
+            left //= 2
+            right //= 2
+        return combine(left_val, right_val)
+
+    def update(self, i, k, f):
+        """applies action f to t[i], t[i + 1], ..., t[k - 1]
+
+        :complexity: O(log len(t))
+        """
+        if i >= k:
+            return
+        left = i + self.N
+        right = k + self.N
+        self._push_boundaries(left, right)
+        lo, hi = left, right
+        while lo < hi:
+            if lo & 1:
+                self._apply(lo, f)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                self._apply(hi, f)
+            lo //= 2
+            hi //= 2
+        combine, s = self.combine, self.s
+        for h in range(1, self.log + 1):        # recompute ancestors
+            if (left >> h) << h != left:
+                p = left >> h
+                s[p] = combine(s[2 * p], s[2 * p + 1])
+            if (right >> h) << h != right:
+                p = (right - 1) >> h
+                s[p] = combine(s[2 * p], s[2 * p + 1])
+# snip}
+
+
 # pylint: disable=protected-access
 if __name__ == '__main__':
     # execute with: rlwrap python3 range_minimum_query.py
@@ -7,13 +7,17 @@ composantes fortement connexes
 jill-jênn vie et christoph dürr - 2015-2018
 """
 
-__all__ = ["tarjan_recursif", "tarjan", "kosaraju", "reverse"]
+from array import array
+from tryalgo.graph import CSRGraph, listlist_and_matrix_to_csr
+
+__all__ = ["tarjan_recursif", "tarjan", "kosaraju", "reverse",
+           "condensation"]
 
 # snip{ sccp-tarjan-recursif
 def tarjan_recursif(graph) -> list[list[int]]:
     """Strongly connected components by Tarjan, recursive implementation
 
-    :param graph: directed graph in listlist format, cannot be listdict
+    :param graph: directed graph in listlist or csr format, cannot be listdict
     :returns: list of lists for each component
     :complexity: linear
     """
@@ -57,7 +61,7 @@ def tarjan_recursif(graph) -> list[list[int]]:
 def tarjan(graph):
     """Strongly connected components by Tarjan, iterative implementation
 
-    :param graph: directed graph in listlist format, cannot be listdict
+    :param graph: directed graph in listlist or csr format, cannot be listdict
     :returns: list of lists for each component
     :complexity: linear
     """
@@ -72,16 +76,15 @@ def tarjan(graph):
     for start in range(n):
         if times_seen[start] == -1:                    # initiate path
             times_seen[start] = 0
-            to_visit = [start]
+            to_visit = [(start, graph[start])]         # children read once
             while to_visit:
-                node = to_visit[-1]                    # top of stack
+                node, children = to_visit[-1]          # top of stack
                 if times_seen[node] == 0:              # start process
                     dfs_num[node] = dfs_time
                     dfs_min[node] = dfs_time
                     dfs_time += 1
                     waiting.append(node)
                     waits[node] = True
-                children = graph[node]
                 if times_seen[node] == len(children):  # end of process
                     to_visit.pop()                     # remove from stack
                     dfs_min[node] = dfs_num[node]      # compute dfs_min
@@ -102,7 +105,7 @@ def tarjan(graph):
                     times_seen[node] += 1
                     if times_seen[child] == -1:        # not visited yet
                         times_seen[child] = 0
-                        to_visit.append(child)
+                        to_visit.append((child, graph[child]))
     return sccp
 # snip}
 
@@ -115,12 +118,11 @@ def kosaraju_dfs(graph, nodes, order, sccp):
     times_seen = [-1] * len(graph)
     for start in nodes:
         if times_seen[start] == -1:                     # initiate DFS
-            to_visit = [start]
+            to_visit = [(start, graph[start])]         # children read once
             times_seen[start] = 0
             sccp.append([start])
             while to_visit:
-                node = to_visit[-1]
-                children = graph[node]
+                node, children = to_visit[-1]
                 if times_seen[node] == len(children):   # end of process
                     to_visit.pop()
                     order.append(node)
@@ -129,7 +131,7 @@ def kosaraju_dfs(graph, nodes, order, sccp):
                     times_seen[node] += 1
                     if times_seen[child] == -1:         # new node
                         times_seen[child] = 0
-                        to_visit.append(child)
+                        to_visit.append((child, graph[child]))
                         sccp[-1].append(child)
 
 
@@ -146,7 +148,7 @@ def reverse(graph):
 def kosaraju(graph):
     """Strongly connected components by Kosaraju
 
-    :param graph: directed graph in listlist format, cannot be listdict
+    :param graph: directed graph in listlist or csr format, cannot be listdict
     :returns: list of lists for each component
     :complexity: linear
     """
@@ -157,3 +159,113 @@ def kosaraju(graph):
     kosaraju_dfs(reverse(graph), order[::-1], [], sccp)
     return sccp[::-1]  # follow inverse topological order
 # snip}
+
+
+# snip{ sccp-condensation
+# pylint: disable=too-many-locals, too-many-branches
+def condensation(graph):
+    """Strongly connected components by Tarjan, iterative implementation
+    on arrays, and the condensation of the graph
+
+    :param graph: directed graph in listlist, listdict or csr format
+    :returns: comp, dag where comp is an array with the component
+              number of every vertex, and dag is the graph of the
+              components in csr format, without multiple arcs.
+              Components are numbered in topological order,
+              so comp[u] <= comp[v] for every arc (u, v).
+    :complexity: linear
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = listlist_and_matrix_to_csr(graph)
+    offset, target = graph.offset, graph.target
+    n = len(graph)
+    dfs_num = [-1] * n              # working tables are lists,
+    dfs_min = [0] * n               # faster to index than arrays
+    comp = [-1] * n                 # -1 while not assigned
+    current = list(offset[:n])      # next arc to explore
+    waiting = []
+    nb_comp = 0
+    dfs_time = 0
+    for start in range(n):
+        if dfs_num[start] >= 0:
+            continue
+        dfs_num[start] = dfs_min[start] = dfs_time
+        dfs_time += 1
+        waiting.append(start)
+        to_visit = [start]
+        while to_visit:
+            node = to_visit[-1]
+            low = dfs_min[node]
+            for arc in range(current[node], offset[node + 1]):
+                child = target[arc]
+                if dfs_num[child] < 0:              # not visited yet
+                    current[node] = arc + 1
+                    dfs_min[node] = low
+                    dfs_num[child] = dfs_min[child] = dfs_time
+                    dfs_time += 1
+                    waiting.append(child)
+                    to_visit.append(child)
+                    break
+                if comp[child] < 0 and dfs_num[child] < low:
+                    low = dfs_num[child]            # child is waiting
+            else:                                   # end of process
+                to_visit.pop()
+                if low == dfs_num[node]:            # representative
+                    while True:
+                        u = waiting.pop()
+                        comp[u] = nb_comp
+                        if u == node:
+                            break
+                    nb_comp += 1
+                elif low < dfs_min[to_visit[-1]]:
+                    dfs_min[to_visit[-1]] = low
+    last = nb_comp - 1              # Tarjan finds them in reverse order
+    comp = array('i', [last - c for c in comp])
+    members = [[] for _ in range(nb_comp)]
+    for u in range(n):
+        members[comp[u]].append(u)
+    dag_offset = array('q', [0])
+    dag_target = array('i')
+    seen = [-1] * nb_comp           # last component pointing to it
+    for c in range(nb_comp):
+        for u in members[c]:
+            for arc in range(offset[u], offset[u + 1]):
+                d = comp[target[arc]]
+                if d != c and seen[d] != c:
+                    seen[d] = c
+                    dag_target.append(d)
+        dag_offset.append(len(dag_target))
+    return comp, CSRGraph(dag_offset, dag_target)
+# snip}
+
+
+# pylint: disable=pointless-string-statement
+if __name__ == "__main__":
+    """
+    benchmark of the implementations on a random graph
+    """
+    from random import randrange, seed
+    from sys import argv
+    from time import perf_counter
+    from typing import List
+    seed(1)
+    N = int(argv[1]) if len(argv) > 1 else 10 ** 6
+    M = int(argv[2]) if len(argv) > 2 else 10 * N
+    TAIL = [randrange(N) for _ in range(M)]
+    HEAD = [randrange(N) for _ in range(M)]
+    GRAPH: List[List[int]] = [[] for _ in range(N)]
+    for u, v in zip(TAIL, HEAD):
+        GRAPH[u].append(v)
+    CSR = listlist_and_matrix_to_csr(GRAPH)
+    print("random graph with %i vertices and %i arcs" % (N, M))
+    for name, algo, graph in [("tarjan_recursif", tarjan_recursif, GRAPH),
+                              ("tarjan", tarjan, GRAPH),
+                              ("kosaraju", kosaraju, GRAPH),
+                              ("condensation", condensation, GRAPH),
+                              ("condensation csr", condensation, CSR)]:
+        start = perf_counter()
+        try:
+            algo(graph)
+            print("%-16s %.2fs" % (name, perf_counter() - start))
+        except RecursionError:
+            print("%-16s recursion limit exceeded" % name)